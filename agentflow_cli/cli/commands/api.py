@@ -104,13 +104,17 @@ class APICommand(BaseCommand):
                     playground_base_url=playground_url,
                 )
 
-            # Start the server
+            # Start the server. permessage-deflate is off: the WebSocket
+            # endpoints fan the same pre-encoded payload out to many clients,
+            # and per-connection deflate would re-compress it once per client
+            # (and keep a compression context per connection).
             uvicorn.run(
                 "agentflow_cli.src.app.main:app",
                 host=validated_options["host"],
                 port=validated_options["port"],
                 reload=reload,
                 workers=1,
+                ws_per_message_deflate=False,
             )
 
             return 0
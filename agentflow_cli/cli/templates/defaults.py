@@ -555,7 +555,10 @@ def generate_dockerfile_content(
             [
                 "# Run the application (production)",
                 "# Use Gunicorn with Uvicorn workers for better performance and multi-core",
-                "# utilization",
+                "# utilization. Gunicorn reads the worker count from WEB_CONCURRENCY;",
+                "# override at run time (e.g. docker run -e WEB_CONCURRENCY=8) to match",
+                "# the host's cores.",
+                "ENV WEB_CONCURRENCY=2",
                 (
                     'CMD ["gunicorn", "-k", "uvicorn.workers.UvicornWorker", '
                     f'"-b", "0.0.0.0:{port}", "agentflow_cli.src.app.main:app"]'
@@ -53,6 +53,13 @@ class AuthorizationBackend(ABC):
             Exception: Can raise exceptions for auth failures or errors
         """
 
+    # Optional fast path: subclasses whose decision needs no I/O may define a plain
+    # (non-async) ``authorize_sync`` with the same signature as ``authorize``. When
+    # present, RequirePermission calls it directly, skipping the coroutine-frame
+    # allocation and event-loop round-trip that ``await authorize(...)`` pays per
+    # request. Deliberately not declared here so it only exists on subclasses that
+    # define it.
+
 
 class DefaultAuthorizationBackend(AuthorizationBackend):
     """
@@ -86,5 +93,16 @@ class DefaultAuthorizationBackend(AuthorizationBackend):
         Returns:
             bool: True if user has 'user_id', False otherwise
         """
+        return self.authorize_sync(user, resource, action, resource_id=resource_id, **context)
+
+    def authorize_sync(
+        self,
+        user: dict[str, Any],
+        resource: str,
+        action: str,
+        resource_id: str | None = None,
+        **context: Any,
+    ) -> bool:
+        """Synchronous fast path for the default allow-all-authenticated policy."""
         # Only check if user is authenticated (has user_id)
         return bool(user.get("user_id"))
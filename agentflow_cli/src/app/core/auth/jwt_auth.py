@@ -1,3 +1,4 @@
+import time
 from typing import Any
 
 from fastapi import Request, Response
@@ -15,7 +16,20 @@ except ImportError:  # pragma: no cover
     jwt = None  # type: ignore[assignment]
 
 
+# Bound on cached decoded tokens (evicted FIFO beyond this), and the cache
+# lifetime used for tokens that carry no exp claim -- those decode the same
+# forever, so the TTL only bounds memory for abandoned tokens.
+_TOKEN_CACHE_MAX_ENTRIES = 4096
+_TOKEN_CACHE_NO_EXP_TTL = 300.0
+
+
 class JwtAuth(BaseAuth):
+    def __init__(self):
+        # Decoded-claims cache keyed by raw token: signature verification is
+        # deterministic, so a token only needs one jwt.decode for its
+        # remaining lifetime. Values are (expires_at, claims).
+        self._token_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
     def authenticate(
         self,
         request: Request,
@@ -56,6 +70,14 @@ class JwtAuth(BaseAuth):
 
         token = credential.credentials
 
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            expires_at, claims = cached
+            if time.time() < expires_at:
+                response.headers["WWW-Authenticate"] = 'Bearer realm="auth_required"'
+                return dict(claims)
+            del self._token_cache[token]
+
         if jwt is None:
             raise ImportError(
                 "PyJWT is required for JWT authentication. "
@@ -94,4 +116,12 @@ class JwtAuth(BaseAuth):
                 message="Invalid token, user_id missing",
                 error_code="INVALID_TOKEN",
             )
-        return decoded_token
+
+        # Cache the verified claims until the token itself expires, so repeat
+        # requests with the same bearer token skip the signature check.
+        if len(self._token_cache) >= _TOKEN_CACHE_MAX_ENTRIES:
+            self._token_cache.pop(next(iter(self._token_cache)), None)
+        expires_at = decoded_token.get("exp") or (time.time() + _TOKEN_CACHE_NO_EXP_TTL)
+        self._token_cache[token] = (float(expires_at), decoded_token)
+
+        return dict(decoded_token)
@@ -5,6 +5,9 @@ This module provides a reusable dependency that combines authentication and
 authorization checks, reducing code duplication across routers.
 """
 
+import logging
+import re
+import time
 from collections.abc import Callable
 from typing import Any, NoReturn
 
@@ -17,6 +20,7 @@ from agentflow_cli.src.app.core import logger
 from agentflow_cli.src.app.core.auth.auth_backend import BaseAuth
 from agentflow_cli.src.app.core.auth.authorization import AuthorizationBackend
 from agentflow_cli.src.app.core.config.graph_config import GraphConfig
+from agentflow_cli.src.app.core.config.settings import get_settings
 from agentflow_cli.src.app.core.utils.log_sanitizer import sanitize_for_logging
 
 
@@ -88,6 +92,90 @@ def _extract_credential(
 # rejection at the WebSocket handshake.
 WS_POLICY_VIOLATION = 1008
 
+# Key under which the request-scoped auth/authz decision cache lives in the ASGI
+# ``state`` dict. When the same (resource, action) dependency is attached at both
+# router and endpoint level, the second resolution reuses the first decision instead
+# of re-running authenticate + authorize.
+_AUTHZ_CACHE_KEY = "_agentflow_authz_cache"
+
+
+# TTL cache for authorize() decisions keyed by (user_id, resource, action,
+# resource_id). Access-control decisions are typically static over short windows, so
+# one cached entry services many requests. Disabled unless Settings.AUTHZ_CACHE_TTL
+# is set > 0 -- revoked permissions stay effective for up to TTL seconds when enabled.
+_DECISION_CACHE_MAX = 4096
+_decision_cache: dict[tuple, tuple[bool, float]] = {}
+
+
+async def _call_authorize(
+    authz: AuthorizationBackend,
+    user: dict[str, Any],
+    resource: str,
+    action: str,
+    resource_id: str | None,
+) -> bool:
+    """Invoke the backend, preferring a plain ``authorize_sync`` when the class has one.
+
+    The sync hook (see AuthorizationBackend) elides the coroutine-frame cost of
+    ``await authorize(...)`` for backends whose decision needs no I/O -- notably
+    DefaultAuthorizationBackend. Looked up on the class so mock/spec instances
+    without a real sync method fall through to the async path.
+    """
+    authorize_sync = getattr(type(authz), "authorize_sync", None)
+    if authorize_sync is not None:
+        return authorize_sync(authz, user, resource, action, resource_id=resource_id)
+    return await authz.authorize(user, resource, action, resource_id=resource_id)
+
+
+async def _authorize_cached(
+    authz: AuthorizationBackend,
+    user: dict[str, Any],
+    resource: str,
+    action: str,
+    resource_id: str | None,
+) -> bool:
+    ttl = get_settings().AUTHZ_CACHE_TTL
+    if ttl <= 0:
+        return await _call_authorize(authz, user, resource, action, resource_id)
+
+    key = (user.get("user_id"), resource, action, resource_id)
+    now = time.monotonic()
+    cached = _decision_cache.get(key)
+    if cached is not None:
+        if cached[1] > now:
+            return cached[0]
+        del _decision_cache[key]
+
+    authorized = await _call_authorize(authz, user, resource, action, resource_id)
+    if len(_decision_cache) >= _DECISION_CACHE_MAX:
+        # Drop expired entries first; clear outright if everything is still live.
+        expired = [k for k, (_, deadline) in _decision_cache.items() if deadline <= now]
+        for k in expired:
+            del _decision_cache[k]
+        if len(_decision_cache) >= _DECISION_CACHE_MAX:
+            _decision_cache.clear()
+    _decision_cache[key] = (authorized, now + ttl)
+    return authorized
+
+
+def _authz_cache(connection: HTTPConnection) -> dict | None:
+    """Return the per-request authz cache dict, or None when no state dict exists."""
+    scope = getattr(connection, "scope", None)
+    if isinstance(scope, dict):
+        scope_state = scope.get("state")
+        if isinstance(scope_state, dict):
+            return scope_state.setdefault(_AUTHZ_CACHE_KEY, {})
+    return None
+
+
+# Matches `{param}` / `{param:converter}` placeholders in a route path template.
+_PATH_PLACEHOLDER_RE = re.compile(r"\{([^}:]+)")
+
+
+def _extract_no_resource_id(connection: HTTPConnection) -> str | None:
+    """Specialized extractor for routes whose path carries no recognized resource id."""
+    return None
+
 
 def _reject(connection: HTTPConnection, status_code: int, detail: str) -> NoReturn:
     """Reject a connection with the error type appropriate to its protocol.
@@ -123,6 +211,15 @@ class RequirePermission:
         extract_resource_id: Optional function to extract resource_id from request
     """
 
+    # Instances live for the app lifetime and are queried on every request;
+    # slots drop the per-instance __dict__ and make attribute access a fixed
+    # slot offset instead of a dict lookup.
+    __slots__ = ("resource", "action", "extract_resource_id_fn")
+
+    # Path-parameter names probed (in priority order) by the default extractor.
+    # Class-level so the per-request lookup doesn't rebuild the tuple.
+    _PRIORITY_PATH_PARAMS = ("thread_id", "memory_id", "namespace")
+
     def __init__(
         self,
         resource: str,
@@ -141,6 +238,32 @@ class RequirePermission:
         self.action = action
         self.extract_resource_id_fn = extract_resource_id
 
+    @classmethod
+    def for_route(cls, path: str, resource: str, action: str) -> "RequirePermission":
+        """Build a RequirePermission with an extractor specialized to a route path.
+
+        Parses ``{param}`` placeholders out of ``path`` once at route-registration
+        time and binds an extractor for the highest-priority recognized parameter
+        (see ``_PRIORITY_PATH_PARAMS``) -- a single dict probe per request instead
+        of the generic priority loop. Routes without a recognized placeholder get
+        an extractor that returns ``None`` without touching ``path_params`` at all.
+
+        Usage:
+            Depends(RequirePermission.for_route(
+                "/v1/threads/{thread_id}/state", "checkpointer", "read"
+            ))
+        """
+        placeholders = set(_PATH_PLACEHOLDER_RE.findall(path))
+        for param_name in cls._PRIORITY_PATH_PARAMS:
+            if param_name in placeholders:
+
+                def _extract(connection: HTTPConnection, _name: str = param_name) -> str | None:
+                    value = connection.path_params.get(_name)
+                    return str(value) if value is not None else None
+
+                return cls(resource, action, extract_resource_id=_extract)
+        return cls(resource, action, extract_resource_id=_extract_no_resource_id)
+
     async def __call__(
         self,
         connection: HTTPConnection,
@@ -164,6 +287,14 @@ class RequirePermission:
             WebSocketException: close 1008 on WebSocket routes for the same failures
                 (FastAPI does not translate an HTTPException on a WS handshake).
         """
+        # Short-circuit duplicate attachments (router + endpoint) of the same
+        # permission within a single request.
+        cache = _authz_cache(connection)
+        if cache is not None:
+            cached_user = cache.get((self.resource, self.action))
+            if cached_user is not None:
+                return cached_user
+
         # Extract bearer credentials from the Authorization header, with a
         # ``?token=`` query fallback for browser WebSocket clients (see
         # _extract_credential). Works for both HTTP and WebSocket connections.
@@ -175,8 +306,10 @@ class RequirePermission:
         # If auth is not configured, skip authentication and authorization entirely
         if not backend:
             logger.debug(
-                f"Auth not configured, skipping auth/authz for {self.resource}:{self.action}"
+                "Auth not configured, skipping auth/authz for %s:%s", self.resource, self.action
             )
+            if cache is not None:
+                cache[(self.resource, self.action)] = {}
             return {}
 
         # Step 2: Authentication (reusing verify_current_user logic)
@@ -200,22 +333,22 @@ class RequirePermission:
             user = user_result or {}
 
         # Step 3: Extract resource_id if available
-        resource_id = None
-        if self.extract_resource_id_fn:
-            resource_id = self.extract_resource_id_fn(connection)
-        else:
-            resource_id = self._extract_resource_id_from_path(connection)
+        extract = self.extract_resource_id_fn or self._extract_resource_id_from_path
+        resource_id = extract(connection)
 
-        # Step 4: Authorization
-        if not await authz.authorize(
+        # Step 4: Authorization (TTL-cached when AUTHZ_CACHE_TTL is enabled)
+        if not await _authorize_cached(
+            authz,
             user,
             self.resource,
             self.action,
-            resource_id=resource_id,
+            resource_id,
         ):
             logger.warning(
-                f"Authorization failed for user {user.get('user_id')} "
-                f"on {self.resource}:{self.action}"
+                "Authorization failed for user %s on %s:%s",
+                user.get("user_id"),
+                self.resource,
+                self.action,
             )
             _reject(
                 connection,
@@ -223,12 +356,18 @@ class RequirePermission:
                 f"Not authorized to {self.action} {self.resource}",
             )
 
-        # Log successful auth/authz (with sanitized user info)
-        logger.debug(
-            f"Auth/Authz success for {self.resource}:{self.action}, "
-            f"user: {sanitize_for_logging(user)}"
-        )
+        # Log successful auth/authz (with sanitized user info). sanitize_for_logging
+        # walks the whole user dict, so only pay for it when DEBUG is actually on.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Auth/Authz success for %s:%s, user: %s",
+                self.resource,
+                self.action,
+                sanitize_for_logging(user),
+            )
 
+        if cache is not None:
+            cache[(self.resource, self.action)] = user
         return user
 
     def _extract_resource_id_from_path(self, connection: HTTPConnection) -> str | None:
@@ -243,12 +382,11 @@ class RequirePermission:
         Returns:
             Resource ID as string, or None if not found
         """
-        # Check path parameters
+        # Check path parameters: one dict probe per candidate name, priority order
         path_params = connection.path_params
-
-        # Common resource ID patterns
-        for param_name in ["thread_id", "memory_id", "namespace"]:
-            if param_name in path_params:
-                return str(path_params[param_name])
+        for param_name in self._PRIORITY_PATH_PARAMS:
+            value = path_params.get(param_name)
+            if value is not None:
+                return str(value)
 
         return None
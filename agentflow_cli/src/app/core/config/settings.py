@@ -6,11 +6,33 @@ from pydantic import ConfigDict, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 
+# Module-level production flag, refreshed by get_settings(). Hot paths can read this
+# (or bind it once at init) as a plain global instead of walking
+# get_settings().MODE == "production" per call. Stays correct across
+# get_settings.cache_clear() because the next get_settings() call rewrites it.
 IS_PRODUCTION = False
 LOGGER_NAME = os.getenv("LOGGER_NAME", "agentflow-cli")
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Production security warning templates (module constants so a Settings instance
+# doesn't reallocate them on every validation pass).
+_WARN_CORS_WILDCARD = (
+    "⚠️  SECURITY WARNING: CORS ORIGINS='*' in production.\n"
+    "   This allows any website to make requests to your API.\n"
+    "   Set ORIGINS to specific domains (e.g., https://yourdomain.com)"
+)
+_WARN_DEBUG_ENABLED = (
+    "⚠️  DEBUG mode is enabled in production. This may expose sensitive information."
+)
+_WARN_DOCS_ENABLED = (
+    "⚠️  API documentation endpoints are enabled in production. "
+    "Consider disabling DOCS_PATH and REDOCS_PATH."
+)
+_WARN_ALLOWED_HOST_WILDCARD = (
+    "⚠️  ALLOWED_HOST='*' in production. Set to specific hostnames for better security."
+)
+
 
 class Settings(BaseSettings):
     """
@@ -60,6 +82,7 @@ class Settings(BaseSettings):
     HSTS_MAX_AGE: int = 31536000  # 1 year in seconds
     HSTS_INCLUDE_SUBDOMAINS: bool = True
     HSTS_PRELOAD: bool = False
+    HSTS_FORCE: str = "auto"  # always | never | auto (check scheme per request)
     FRAME_OPTIONS: str = "DENY"  # DENY, SAMEORIGIN, or ALLOW-FROM
     CONTENT_TYPE_OPTIONS: str = "nosniff"
     XSS_PROTECTION: str = "1; mode=block"
@@ -95,6 +118,11 @@ class Settings(BaseSettings):
     #################################
     ###### Auth ############
     #################################
+    # TTL (seconds) for caching authorize() decisions keyed by
+    # (user_id, resource, action, resource_id). 0 disables the cache; enable it
+    # only when access-control decisions are stable for the chosen window.
+    AUTHZ_CACHE_TTL: float = 0.0
+
     SNOWFLAKE_EPOCH: int = 1609459200000
     SNOWFLAKE_NODE_ID: int = 1
     SNOWFLAKE_WORKER_ID: int = 2
@@ -122,44 +150,47 @@ class Settings(BaseSettings):
         """Normalize MODE to lowercase."""
         return v.lower() if v else "development"
 
-    @field_validator("ORIGINS")
+    @field_validator("HSTS_FORCE", mode="before")
     @classmethod
-    def warn_cors_wildcard(cls, v: str) -> str:
-        """Warn if CORS is set to wildcard in production."""
-        mode = os.environ.get("MODE", "development").lower()
-        if v == "*" and mode == "production":
+    def normalize_hsts_force(cls, v: str | None) -> str:
+        """Normalize HSTS_FORCE; warn and fall back to "auto" on invalid values.
+
+        The middleware compares against exact "always"/"never"/"auto", so an
+        unrecognized value would silently disable HSTS.
+        """
+        normalized = v.lower() if v else "auto"
+        if normalized not in ("always", "never", "auto"):
             logger.warning(
-                "⚠️  SECURITY WARNING: CORS ORIGINS='*' in production.\n"
-                "   This allows any website to make requests to your API.\n"
-                "   Set ORIGINS to specific domains (e.g., https://yourdomain.com)"
+                "Invalid HSTS_FORCE=%r, falling back to 'auto'. Valid: always, never, auto",
+                v,
             )
-        return v
+            return "auto"
+        return normalized
 
     @model_validator(mode="after")
     def check_production_security(self):
-        """Check for insecure configurations in production mode."""
-        if self.MODE == "production":
-            warnings = []
-
-            if self.IS_DEBUG:
-                warnings.append(
-                    "⚠️  DEBUG mode is enabled in production. This may expose sensitive information."
-                )
-
-            if self.DOCS_PATH or self.REDOCS_PATH:
-                warnings.append(
-                    "⚠️  API documentation endpoints are enabled in production. "
-                    "Consider disabling DOCS_PATH and REDOCS_PATH."
-                )
-
-            if self.ALLOWED_HOST == "*":
-                warnings.append(
-                    "⚠️  ALLOWED_HOST='*' in production. "
-                    "Set to specific hostnames for better security."
-                )
-
-            if warnings:
-                logger.warning("\n".join(["\n🔒 PRODUCTION SECURITY WARNINGS:", *warnings]))
+        """Check for insecure configurations in production mode (single pass)."""
+        if self.MODE != "production":
+            return self
+
+        # Normalized MODE is already on the model here, so the CORS wildcard check
+        # shares this pass instead of re-reading os.environ in a field validator.
+        if self.ORIGINS == "*":
+            logger.warning(_WARN_CORS_WILDCARD)
+
+        warnings = []
+
+        if self.IS_DEBUG:
+            warnings.append(_WARN_DEBUG_ENABLED)
+
+        if self.DOCS_PATH or self.REDOCS_PATH:
+            warnings.append(_WARN_DOCS_ENABLED)
+
+        if self.ALLOWED_HOST == "*":
+            warnings.append(_WARN_ALLOWED_HOST_WILDCARD)
+
+        if warnings:
+            logger.warning("\n".join(["\n🔒 PRODUCTION SECURITY WARNINGS:", *warnings]))
 
         return self
 
@@ -171,9 +202,14 @@ def get_settings() -> Settings:
     """
     Retrieve and return the application settings.
     If not in production, load settings from a specific environment file.
+    Also refreshes the module-level IS_PRODUCTION flag for hot-path checks.
     Returns:
         Settings: An instance of the Settings class containing
         application configurations.
     """
+    global IS_PRODUCTION  # noqa: PLW0603
+
     logger.info("Loading settings from environment variables and .env if present")
-    return Settings()  # type: ignore
+    settings = Settings()  # type: ignore
+    IS_PRODUCTION = settings.MODE == "production"
+    return settings
@@ -35,12 +35,10 @@ def init_logger(level: int | str = logging.INFO) -> None:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
 
-    # Create formatter
-    base_formatter = logging.Formatter(
+    # Create sanitizing formatter to prevent sensitive data in logs
+    formatter = SanitizingFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
     )
-    # Wrap with sanitizing formatter to prevent sensitive data in logs
-    formatter = SanitizingFormatter(base_formatter)
 
     # Add formatter to console handler
     console_handler.setFormatter(formatter)
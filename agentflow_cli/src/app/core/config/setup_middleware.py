@@ -10,6 +10,7 @@ from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from agentflow_cli.src.app.core.middleware.profiler import ProfilerMiddleware
 from agentflow_cli.src.app.core.middleware.rate_limit import RateLimitMiddleware, build_backend
 from agentflow_cli.src.app.core.middleware.request_limits import RequestSizeLimitMiddleware
 from agentflow_cli.src.app.core.middleware.security_headers import SecurityHeadersMiddleware
@@ -84,7 +85,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         # Add request ID and timestamp to request headers
         request.state.request_id = request_id
         request.state.timestamp = timestamp
-        logger.debug(f"Requesting: Request ID: {request_id}, Timestamp: {timestamp}")
+        logger.debug("Requesting: Request ID: %s, Timestamp: %s", request_id, timestamp)
 
         # Proceed with the request
         response = await call_next(request)
@@ -92,7 +93,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         # Add request ID and timestamp to response headers for logging
         response.headers["X-Request-ID"] = request_id
         response.headers["X-Timestamp"] = timestamp
-        logger.debug(f"Response: Request ID: {request_id}, Timestamp: {timestamp}")
+        logger.debug("Response: Request ID: %s, Timestamp: %s", request_id, timestamp)
 
         return response
 
@@ -245,10 +246,16 @@ def setup_middleware(
             referrer_policy=settings.REFERRER_POLICY,
             permissions_policy=settings.PERMISSIONS_POLICY,
             csp_policy=settings.CSP_POLICY,
+            force_hsts=settings.HSTS_FORCE,
         )
 
     app.add_middleware(RequestIDMiddleware)
 
+    # On-demand request profiling via ?profile=1 (pyinstrument). Never mounted in
+    # production, and a no-op without the query flag, so it only costs when asked.
+    if settings.MODE != "production":
+        app.add_middleware(ProfilerMiddleware)
+
     # Use SelectiveGZipMiddleware to exclude streaming endpoints from compression
     # Streaming endpoints need immediate data transmission without buffering
     app.add_middleware(SelectiveGZipMiddleware, minimum_size=1000)
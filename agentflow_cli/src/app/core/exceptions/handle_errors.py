@@ -1,4 +1,5 @@
 # Handle all exceptions of agentflow here
+import orjson
 from agentflow.core.exceptions import (
     GraphError,
     GraphRecursionError,
@@ -11,9 +12,12 @@ from agentflow.core.exceptions import (
 )
 from agentflow.utils.validators import ValidationError
 from fastapi import FastAPI
+from fastapi.exception_handlers import websocket_request_validation_exception_handler
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
 from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from agentflow_cli.src.app.core import logger
 from agentflow_cli.src.app.core.config.settings import get_settings
@@ -27,6 +31,63 @@ from .user_exception import (
 )
 
 
+# Generic production messages, precomputed at import so the per-error lookup is a dict
+# probe plus (at most) a short prefix scan instead of rebuilding the dict per call.
+_GENERIC_MESSAGES_EXACT = {
+    "VALIDATION_ERROR": "The request data is invalid. Please check your input.",
+    "HTTPException": "An error occurred processing your request.",
+}
+
+# Prefix families (GRAPH_001, NODE_003, ...), longest first so more specific
+# prefixes win if they ever overlap.
+_GENERIC_MESSAGES_PREFIX = tuple(
+    sorted(
+        [
+            ("GRAPH_", "An error occurred executing the graph."),
+            ("NODE_", "An error occurred in a graph node."),
+            ("STORAGE_", "An error occurred accessing storage."),
+            ("METRICS_", "An error occurred collecting metrics."),
+            ("SCHEMA_VERSION_", "Schema version mismatch."),
+            ("SERIALIZATION_", "An error occurred processing data."),
+        ],
+        key=lambda pair: len(pair[0]),
+        reverse=True,
+    )
+)
+
+_GENERIC_MESSAGE_DEFAULT = "An unexpected error occurred. Please contact support."
+
+# Agentflow exception dispatch table: class -> (default error_code, HTTP status).
+# One shared handler resolves through this instead of a closure per class, so
+# adding a new agentflow exception type is a single dict entry here.
+_AGENTFLOW_HANDLER_TABLE: dict[type[Exception], tuple[str, int]] = {
+    GraphError: ("GRAPH_000", 500),
+    NodeError: ("NODE_000", 500),
+    GraphRecursionError: ("GRAPH_RECURSION_000", 500),
+    StorageError: ("STORAGE_000", 500),
+    TransientStorageError: ("TRANSIENT_STORAGE_000", 503),
+    MetricsError: ("METRICS_000", 500),
+    SchemaVersionError: ("SCHEMA_VERSION_000", 422),
+    SerializationError: ("SERIALIZATION_000", 500),
+}
+
+
+def _lookup_handler_entry(exc_type: type[Exception]) -> tuple[str, int]:
+    """Resolve the dispatch-table entry for an exception type.
+
+    Exact hit is a single dict probe; subclasses of a registered type (which
+    Starlette routes here via its own MRO walk) fall back to the same walk.
+    """
+    entry = _AGENTFLOW_HANDLER_TABLE.get(exc_type)
+    if entry is not None:
+        return entry
+    for base in exc_type.__mro__:
+        entry = _AGENTFLOW_HANDLER_TABLE.get(base)
+        if entry is not None:
+            return entry
+    return ("UNKNOWN_ERROR", 500)
+
+
 def _sanitize_error_message(message: str, error_code: str, is_production: bool) -> str:
     """
     Sanitize error messages for production to avoid exposing internal details.
@@ -42,27 +103,157 @@ def _sanitize_error_message(message: str, error_code: str, is_production: bool)
     if not is_production:
         return message
 
-    # Generic messages by status code category
-    generic_messages = {
-        "VALIDATION_ERROR": "The request data is invalid. Please check your input.",
-        "HTTPException": "An error occurred processing your request.",
-        "GRAPH_": "An error occurred executing the graph.",
-        "NODE_": "An error occurred in a graph node.",
-        "STORAGE_": "An error occurred accessing storage.",
-        "METRICS_": "An error occurred collecting metrics.",
-        "SCHEMA_VERSION_": "Schema version mismatch.",
-        "SERIALIZATION_": "An error occurred processing data.",
-    }
-
-    # Return generic message based on error code prefix
-    for prefix, generic_msg in generic_messages.items():
+    generic_msg = _GENERIC_MESSAGES_EXACT.get(error_code)
+    if generic_msg is not None:
+        return generic_msg
+
+    for prefix, prefix_msg in _GENERIC_MESSAGES_PREFIX:
         if error_code.startswith(prefix):
-            return generic_msg
+            return prefix_msg
+
+    return _GENERIC_MESSAGE_DEFAULT
+
 
-    return "An unexpected error occurred. Please contact support."
+class ErrorASGIMiddleware:
+    """Pure ASGI handler for the two hottest error paths.
 
+    ``HTTPException`` and ``RequestValidationError`` account for nearly all failing
+    requests in production. Handling them as a raw ASGI callable wrapped directly
+    around the router skips FastAPI's handler dispatch and the ``Request``/``Response``
+    object construction that a regular ``@app.exception_handler`` pays per request:
+    the response is a single pre-built ``send`` pair over orjson-encoded bytes.
 
-def init_errors_handler(app: FastAPI):  # noqa: PLR0915
+    ``init_errors_handler`` appends this middleware innermost (and registers re-raising
+    handlers for the two exception types) so error responses still flow out through the
+    CORS / security-header / request-ID middleware.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.is_production = get_settings().MODE == "production"
+
+        # In production every HTTPException / validation failure returns the same
+        # sanitized generic body, so serialize the fixed "error" half once here.
+        # Only the per-request metadata object is encoded at send time.
+        self._prebuilt: dict[str, tuple[bytes, str]] = {}
+        if self.is_production:
+            for code in ("HTTPException", "VALIDATION_ERROR"):
+                message = _sanitize_error_message("", code, True)
+                head = orjson.dumps({"error": {"code": code, "message": message, "details": []}})
+                self._prebuilt[code] = (head[:-1] + b',"metadata":', message)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def sender(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, sender)
+        except HTTPException as exc:
+            if response_started:
+                raise
+            await self._handle_http_exception(scope, send, exc)
+        except RequestValidationError as exc:
+            if response_started:
+                raise
+            await self._handle_validation_error(scope, send, exc)
+
+    async def _handle_http_exception(self, scope: Scope, send: Send, exc: HTTPException) -> None:
+        logger.error("HTTP exception: path: %s", scope.get("path"), exc_info=exc)
+
+        # Log full details but return sanitized message in production
+        if self.is_production:
+            request_id = scope.get("state", {}).get("request_id", "unknown")
+            logger.error("Request %s - HTTPException details: %s", request_id, exc.detail)
+            await self._send_prebuilt(scope, send, exc.status_code, "HTTPException")
+            return
+
+        message = _sanitize_error_message(str(exc.detail), "HTTPException", False)
+        await self._send_error(scope, send, exc.status_code, "HTTPException", message)
+
+    async def _handle_validation_error(
+        self, scope: Scope, send: Send, exc: RequestValidationError
+    ) -> None:
+        logger.error("Validation error exception: path: %s", scope.get("path"), exc_info=exc)
+
+        details = [ErrorSchemas(**error) for error in exc.errors()]
+
+        # In production, sanitize validation error details
+        if self.is_production:
+            request_id = scope.get("state", {}).get("request_id", "unknown")
+            logger.error("Request %s - Validation errors: %s", request_id, details)
+            await self._send_prebuilt(scope, send, 422, "VALIDATION_ERROR")
+            return
+
+        message = str(exc.body) if exc.body else "Validation error"
+        await self._send_error(scope, send, 422, "VALIDATION_ERROR", message, details)
+
+    async def _send_error(
+        self,
+        scope: Scope,
+        send: Send,
+        status_code: int,
+        error_code: str,
+        message: str,
+        details: list[ErrorSchemas] | None = None,
+    ) -> None:
+        """Send an ``ErrorResponse``-shaped JSON body directly over the ASGI interface."""
+        state = scope.get("state", {})
+        body = orjson.dumps(
+            {
+                "error": {
+                    "code": error_code,
+                    "message": message,
+                    "details": [detail.model_dump() for detail in details] if details else [],
+                },
+                "metadata": {
+                    "request_id": state.get("request_id", "unknown"),
+                    "timestamp": state.get("timestamp", ""),
+                    "message": message,
+                },
+            }
+        )
+        await self._send_json(send, status_code, body)
+
+    async def _send_prebuilt(
+        self, scope: Scope, send: Send, status_code: int, error_code: str
+    ) -> None:
+        """Production generic path: splice per-request metadata onto the prebuilt body."""
+        head, message = self._prebuilt[error_code]
+        state = scope.get("state", {})
+        metadata = orjson.dumps(
+            {
+                "request_id": state.get("request_id", "unknown"),
+                "timestamp": state.get("timestamp", ""),
+                "message": message,
+            }
+        )
+        await self._send_json(send, status_code, head + metadata + b"}")
+
+    @staticmethod
+    async def _send_json(send: Send, status_code: int, body: bytes) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def init_errors_handler(app: FastAPI):
     """
     Initialize error handlers for the FastAPI application.
 
@@ -80,60 +271,40 @@ def init_errors_handler(app: FastAPI):  # noqa: PLR0915
     settings = get_settings()
     is_production = settings.MODE == "production"
 
+    # Handler-local bindings: every handler below reads these per request, so resolve
+    # the globals once here instead of paying LOAD_GLOBAL + attribute lookups each time.
+    _log_error = logger.error
+    _error_response = error_response
+
+    # HTTPException and RequestValidationError are handled by ErrorASGIMiddleware on the
+    # hot path. The registered handlers just re-raise so the exceptions escape Starlette's
+    # per-route wrapper and reach the middleware; WebSocket validation failures keep
+    # FastAPI's clean close-1008 behavior.
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
-        logger.error(f"HTTP exception: url: {request.base_url}", exc_info=exc)
-
-        # Get request ID for tracking
-        request_id = getattr(request.state, "request_id", "unknown")
-
-        message = _sanitize_error_message(str(exc.detail), "HTTPException", is_production)
-
-        # Log full details but return sanitized message in production
-        if is_production:
-            logger.error(f"Request {request_id} - HTTPException details: {exc.detail}")
-
-        return error_response(
-            request,
-            error_code="HTTPException",
-            message=message,
-            status_code=exc.status_code,
-        )
+        raise exc
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
-        logger.error(f"Value error exception: url: {request.base_url}", exc_info=exc)
-
-        request_id = getattr(request.state, "request_id", "unknown")
-        details = [ErrorSchemas(**error) for error in exc.errors()]
+        if request.scope["type"] == "websocket":
+            return await websocket_request_validation_exception_handler(request, exc)  # type: ignore[arg-type]
+        raise exc
 
-        # In production, sanitize validation error details
-        if is_production:
-            logger.error(f"Request {request_id} - Validation errors: {details}")
-            message = "The request data is invalid. Please check your input."
-        else:
-            message = str(exc.body) if exc.body else "Validation error"
-
-        return error_response(
-            request,
-            error_code="VALIDATION_ERROR",
-            message=message,
-            details=details if not is_production else None,
-            status_code=422,
-        )
+    # Append (not add_middleware, which prepends) so the middleware wraps the router
+    # innermost and its responses still pass through CORS / security headers / request ID.
+    app.user_middleware.append(Middleware(ErrorASGIMiddleware))
 
     @app.exception_handler(ValueError)
     async def value_exception_handler(request: Request, exc: ValueError):
-        logger.error(f"Value error exception: url: {request.base_url}", exc_info=exc)
-
-        request_id = getattr(request.state, "request_id", "unknown")
+        _log_error("Value error exception: url: %s", request.base_url, exc_info=exc)
 
         message = str(exc)
         if is_production:
-            logger.error(f"Request {request_id} - ValueError details: {message}")
+            request_id = request.scope.get("state", {}).get("request_id", "unknown")
+            _log_error("Request %s - ValueError details: %s", request_id, message)
             message = "Invalid input provided."
 
-        return error_response(
+        return _error_response(
             request,
             error_code="VALIDATION_ERROR",
             message=message,
@@ -145,8 +316,8 @@ def init_errors_handler(app: FastAPI):  # noqa: PLR0915
     ########################################
     @app.exception_handler(UserAccountError)
     async def user_account_exception_handler(request: Request, exc: UserAccountError):
-        logger.error(f"UserAccountError: url: {request.base_url}", exc_info=exc)
-        return error_response(
+        _log_error("UserAccountError: url: %s", request.base_url, exc_info=exc)
+        return _error_response(
             request,
             error_code=exc.error_code,
             message=exc.message,
@@ -155,8 +326,8 @@ def init_errors_handler(app: FastAPI):  # noqa: PLR0915
 
     @app.exception_handler(UserPermissionError)
     async def user_write_exception_handler(request: Request, exc: UserPermissionError):
-        logger.error(f"UserPermissionError: url: {request.base_url}", exc_info=exc)
-        return error_response(
+        _log_error("UserPermissionError: url: %s", request.base_url, exc_info=exc)
+        return _error_response(
             request,
             error_code=exc.error_code,
             message=exc.message,
@@ -165,190 +336,55 @@ def init_errors_handler(app: FastAPI):  # noqa: PLR0915
 
     @app.exception_handler(APIResourceNotFoundError)
     async def resource_not_found_exception_handler(request: Request, exc: APIResourceNotFoundError):
-        logger.error(f"ResourceNotFoundError: url: {request.base_url}", exc_info=exc)
-        return error_response(
+        _log_error("ResourceNotFoundError: url: %s", request.base_url, exc_info=exc)
+        return _error_response(
             request,
             error_code=exc.error_code,
             message=exc.message,
             status_code=exc.status_code,
         )
 
-    ## Need to handle agentflow specific exceptions here
-    @app.exception_handler(ValidationError)
-    async def agentflow_validation_exception_handler(request: Request, exc: ValidationError):
-        logger.error(f"AgentFlow ValidationError: url: {request.base_url}", exc_info=exc)
-
-        request_id = getattr(request.state, "request_id", "unknown")
-        message = _sanitize_error_message(str(exc), "AGENTFLOW_VALIDATION_ERROR", is_production)
-
-        if is_production:
-            logger.error(f"Request {request_id} - AgentFlow ValidationError: {exc}")
-
-        return error_response(
-            request,
-            error_code="AGENTFLOW_VALIDATION_ERROR",
-            message=message,
-            status_code=422,
-        )
-
-    @app.exception_handler(GraphError)
-    async def graph_error_exception_handler(request: Request, exc: GraphError):
-        logger.error(f"GraphError: url: {request.base_url}", exc_info=exc)
-
-        request_id = getattr(request.state, "request_id", "unknown")
-        error_code = getattr(exc, "error_code", "GRAPH_000")
-        original_message = getattr(exc, "message", str(exc))
-        message = _sanitize_error_message(original_message, error_code, is_production)
-
-        if is_production:
-            logger.error(f"Request {request_id} - GraphError: {original_message}")
-
-        return error_response(
-            request,
-            error_code=error_code,
-            message=message,
-            details=getattr(exc, "context", None) if not is_production else None,
-            status_code=500,
-        )
-
-    @app.exception_handler(NodeError)
-    async def node_error_exception_handler(request: Request, exc: NodeError):
-        logger.error(f"NodeError: url: {request.base_url}", exc_info=exc)
-
-        request_id = getattr(request.state, "request_id", "unknown")
-        error_code = getattr(exc, "error_code", "NODE_000")
-        original_message = getattr(exc, "message", str(exc))
-        message = _sanitize_error_message(original_message, error_code, is_production)
-
-        if is_production:
-            logger.error(f"Request {request_id} - NodeError: {original_message}")
-
-        return error_response(
-            request,
-            error_code=error_code,
-            message=message,
-            details=getattr(exc, "context", None) if not is_production else None,
-            status_code=500,
-        )
-
-    @app.exception_handler(GraphRecursionError)
-    async def graph_recursion_error_exception_handler(request: Request, exc: GraphRecursionError):
-        logger.error(f"GraphRecursionError: url: {request.base_url}", exc_info=exc)
-
-        request_id = getattr(request.state, "request_id", "unknown")
-        error_code = getattr(exc, "error_code", "GRAPH_RECURSION_000")
-        original_message = getattr(exc, "message", str(exc))
-        message = _sanitize_error_message(original_message, error_code, is_production)
-
-        if is_production:
-            logger.error(f"Request {request_id} - GraphRecursionError: {original_message}")
-
-        return error_response(
-            request,
-            error_code=error_code,
-            message=message,
-            details=getattr(exc, "context", None) if not is_production else None,
-            status_code=500,
-        )
-
-    @app.exception_handler(StorageError)
-    async def storage_error_exception_handler(request: Request, exc: StorageError):
-        logger.error(f"StorageError: url: {request.base_url}", exc_info=exc)
-
-        request_id = getattr(request.state, "request_id", "unknown")
-        error_code = getattr(exc, "error_code", "STORAGE_000")
-        original_message = getattr(exc, "message", str(exc))
-        message = _sanitize_error_message(original_message, error_code, is_production)
-
-        if is_production:
-            logger.error(f"Request {request_id} - StorageError: {original_message}")
-
-        return error_response(
-            request,
-            error_code=error_code,
-            message=message,
-            details=getattr(exc, "context", None) if not is_production else None,
-            status_code=500,
-        )
+    ## Need to handle agentflow specific exceptions here: one shared handler driven
+    ## by _AGENTFLOW_HANDLER_TABLE instead of a near-identical closure per class.
+    async def agentflow_exception_handler(request: Request, exc: Exception):
+        exc_type = type(exc)
+        default_code, status_code = _lookup_handler_entry(exc_type)
 
-    @app.exception_handler(TransientStorageError)
-    async def transient_storage_error_exception_handler(
-        request: Request, exc: TransientStorageError
-    ):
-        logger.error(f"TransientStorageError: url: {request.base_url}", exc_info=exc)
+        exc_name = exc_type.__name__
+        _log_error("%s: url: %s", exc_name, request.base_url, exc_info=exc)
 
-        request_id = getattr(request.state, "request_id", "unknown")
-        error_code = getattr(exc, "error_code", "TRANSIENT_STORAGE_000")
+        error_code = getattr(exc, "error_code", default_code)
         original_message = getattr(exc, "message", str(exc))
         message = _sanitize_error_message(original_message, error_code, is_production)
 
         if is_production:
-            logger.error(f"Request {request_id} - TransientStorageError: {original_message}")
+            request_id = request.scope.get("state", {}).get("request_id", "unknown")
+            _log_error("Request %s - %s: %s", request_id, exc_name, original_message)
 
-        return error_response(
+        return _error_response(
             request,
             error_code=error_code,
             message=message,
             details=getattr(exc, "context", None) if not is_production else None,
-            status_code=503,
+            status_code=status_code,
         )
 
-    @app.exception_handler(MetricsError)
-    async def metrics_error_exception_handler(request: Request, exc: MetricsError):
-        logger.error(f"MetricsError: url: {request.base_url}", exc_info=exc)
-
-        request_id = getattr(request.state, "request_id", "unknown")
-        error_code = getattr(exc, "error_code", "METRICS_000")
-        original_message = getattr(exc, "message", str(exc))
-        message = _sanitize_error_message(original_message, error_code, is_production)
-
-        if is_production:
-            logger.error(f"Request {request_id} - MetricsError: {original_message}")
-
-        return error_response(
-            request,
-            error_code=error_code,
-            message=message,
-            details=getattr(exc, "context", None) if not is_production else None,
-            status_code=500,
-        )
+    for exc_cls in _AGENTFLOW_HANDLER_TABLE:
+        app.add_exception_handler(exc_cls, agentflow_exception_handler)
 
-    @app.exception_handler(SchemaVersionError)
-    async def schema_version_error_exception_handler(request: Request, exc: SchemaVersionError):
-        logger.error(f"SchemaVersionError: url: {request.base_url}", exc_info=exc)
+    @app.exception_handler(ValidationError)
+    async def agentflow_validation_exception_handler(request: Request, exc: ValidationError):
+        _log_error("AgentFlow ValidationError: url: %s", request.base_url, exc_info=exc)
 
-        request_id = getattr(request.state, "request_id", "unknown")
-        error_code = getattr(exc, "error_code", "SCHEMA_VERSION_000")
-        original_message = getattr(exc, "message", str(exc))
-        message = _sanitize_error_message(original_message, error_code, is_production)
+        message = _sanitize_error_message(str(exc), "AGENTFLOW_VALIDATION_ERROR", is_production)
 
         if is_production:
-            logger.error(f"Request {request_id} - SchemaVersionError: {original_message}")
+            request_id = request.scope.get("state", {}).get("request_id", "unknown")
+            _log_error("Request %s - AgentFlow ValidationError: %s", request_id, exc)
 
-        return error_response(
+        return _error_response(
             request,
-            error_code=error_code,
+            error_code="AGENTFLOW_VALIDATION_ERROR",
             message=message,
-            details=getattr(exc, "context", None) if not is_production else None,
             status_code=422,
         )
-
-    @app.exception_handler(SerializationError)
-    async def serialization_error_exception_handler(request: Request, exc: SerializationError):
-        logger.error(f"SerializationError: url: {request.base_url}", exc_info=exc)
-
-        request_id = getattr(request.state, "request_id", "unknown")
-        error_code = getattr(exc, "error_code", "SERIALIZATION_000")
-        original_message = getattr(exc, "message", str(exc))
-        message = _sanitize_error_message(original_message, error_code, is_production)
-
-        if is_production:
-            logger.error(f"Request {request_id} - SerializationError: {original_message}")
-
-        return error_response(
-            request,
-            error_code=error_code,
-            message=message,
-            details=getattr(exc, "context", None) if not is_production else None,
-            status_code=500,
-        )
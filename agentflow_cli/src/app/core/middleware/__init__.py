@@ -1,5 +1,6 @@
 """Middleware modules for agentflow-cli."""
 
+from .profiler import ProfilerMiddleware
 from .rate_limit import (
     BaseRateLimitBackend,
     MemoryRateLimitBackend,
@@ -19,6 +20,7 @@ __all__ = [
     "MemoryRateLimitBackend",
     "RedisRateLimitBackend",
     "build_backend",
+    "ProfilerMiddleware",
     "RequestSizeLimitMiddleware",
     "SecurityHeadersMiddleware",
     "create_security_headers_middleware",
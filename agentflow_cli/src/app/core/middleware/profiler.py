@@ -0,0 +1,78 @@
+"""
+Profiler Middleware
+
+Query-parameter-gated request profiling built on pyinstrument. Append
+``?profile=1`` to any endpoint to receive the pyinstrument HTML report for that
+single request instead of the normal response, showing exactly where wall time
+is spent across middleware, auth, and handler code.
+
+The middleware is a no-op unless the query flag is present, and it is only
+mounted outside production mode (see ``setup_middleware``), so it cannot affect
+production latency.
+
+Requires the ``profiling`` extra:
+
+    pip install '10xscale-agentflow-cli[profiling]'
+"""
+
+from collections.abc import Callable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, Response
+
+from agentflow_cli.src.app.core.config.settings import logger
+
+
+class ProfilerMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that profiles a single request on demand.
+
+    When the request carries ``?profile=1``, the whole downstream stack
+    (remaining middleware, dependency resolution, handler) runs under a
+    pyinstrument sampler and the response is replaced with the HTML profile
+    report. All other requests pass through untouched.
+    """
+
+    def __init__(self, app, interval: float = 0.001):
+        """
+        Initialize the profiler middleware.
+
+        Args:
+            app: ASGI application
+            interval: Sampling interval in seconds (default: 1ms)
+        """
+        super().__init__(app)
+        self.interval = interval
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Profile the request when ``?profile=1`` is present.
+
+        Args:
+            request: Incoming request
+            call_next: Next middleware/handler
+
+        Returns:
+            The pyinstrument HTML report for profiled requests, the normal
+            response otherwise (including when pyinstrument is not installed).
+        """
+        if request.query_params.get("profile") != "1":
+            return await call_next(request)
+
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning(
+                "?profile=1 requested but pyinstrument is not installed. "
+                "Install with: pip install '10xscale-agentflow-cli[profiling]'"
+            )
+            return await call_next(request)
+
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await call_next(request)
+        finally:
+            profiler.stop()
+        return HTMLResponse(profiler.output_html())
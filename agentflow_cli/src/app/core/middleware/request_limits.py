@@ -1,72 +1,163 @@
 """Request size limit middleware for DoS protection."""
 
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+import orjson
+from fastapi import HTTPException, status
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from agentflow_cli.src.app.core import logger
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
+# Methods whose requests carry no meaningful body; the size check is skipped
+# for them so the middleware costs a single set probe on read-heavy traffic.
+# Only GET/HEAD qualify: DELETE (and OPTIONS) may legally carry a body, so
+# they keep the full Content-Length and chunked-body enforcement.
+_BODYLESS_METHODS = frozenset({"GET", "HEAD"})
+
+
+class RequestSizeLimitMiddleware:
     """
     Middleware to enforce maximum request body size limits.
 
     This prevents DoS attacks through excessively large request bodies.
 
+    Implemented as a pure ASGI callable (not ``BaseHTTPMiddleware``) so the
+    common pass-through case costs one scan of the raw ``scope["headers"]``
+    list instead of an anyio task group plus ``Request``/``Headers`` object
+    construction per request.
+
     Args:
         app: The ASGI application
         max_size: Maximum request body size in bytes (default: 10MB)
     """
 
-    def __init__(self, app, max_size: int = 10 * 1024 * 1024):
-        super().__init__(app)
+    __slots__ = ("app", "max_size", "max_size_mb", "_413_prefix", "_413_suffix")
+
+    def __init__(self, app: ASGIApp, max_size: int = 10 * 1024 * 1024):
+        self.app = app
         self.max_size = max_size
         self.max_size_mb = max_size / (1024 * 1024)
 
-    async def dispatch(self, request: Request, call_next):
+        # Everything in the 413 body except request_id is fixed at construction,
+        # so serialize the skeleton once and splice the request_id in at send
+        # time -- no dict build or JSON encode on the rejection path.
+        payload = orjson.dumps(
+            {
+                "error": {
+                    "code": "REQUEST_TOO_LARGE",
+                    "message": (
+                        f"Request body too large. Maximum size is {self.max_size_mb:.1f}MB"
+                    ),
+                    "max_size_bytes": self.max_size,
+                    "max_size_mb": self.max_size_mb,
+                },
+                "metadata": {
+                    "request_id": "__RID__",
+                    "status": "error",
+                },
+            }
+        )
+        self._413_prefix, self._413_suffix = payload.split(b'"__RID__"')
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Check request size and reject if too large.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or route handler
-
-        Returns:
-            Response: Either the normal response or 413 Payload Too Large
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
-        # Get content-length header
-        content_length = request.headers.get("content-length")
+        if scope["type"] != "http" or scope["method"] in _BODYLESS_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        # Scan the raw header list once for content-length and transfer-encoding
+        # (header names arrive lowercased from the server, so a bytes compare
+        # suffices). Chunked requests have no Content-Length, so they get a
+        # streaming cap instead -- otherwise they'd bypass the limit entirely.
+        content_length = None
+        chunked = False
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = value
+            elif name == b"transfer-encoding" and b"chunked" in value.lower():
+                chunked = True
 
-        if content_length:
-            content_length_bytes = int(content_length)
+        if content_length is not None:
+            try:
+                content_length_bytes = int(content_length)
+            except ValueError:
+                # Malformed header is a client error, not a server crash
+                logger.warning("Request rejected: malformed Content-Length %r", content_length)
+                response = Response(
+                    content=orjson.dumps(
+                        {
+                            "error": {
+                                "code": "INVALID_CONTENT_LENGTH",
+                                "message": "Invalid Content-Length header",
+                            }
+                        }
+                    ),
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    media_type="application/json",
+                )
+                await response(scope, receive, send)
+                return
 
             if content_length_bytes > self.max_size:
                 logger.warning(
-                    f"Request rejected: size {content_length_bytes} bytes "
-                    f"exceeds limit of {self.max_size} bytes "
-                    f"({self.max_size_mb:.1f}MB)"
+                    "Request rejected: size %d bytes exceeds limit of %d bytes (%.1fMB)",
+                    content_length_bytes,
+                    self.max_size,
+                    self.max_size_mb,
                 )
 
-                # Get request ID if available
-                request_id = getattr(request.state, "request_id", "unknown")
+                # Get request ID if available and splice it into the prebuilt body
+                request_id = scope.get("state", {}).get("request_id", "unknown")
+                body = self._413_prefix + orjson.dumps(request_id) + self._413_suffix
 
-                return JSONResponse(
+                response = Response(
+                    content=body,
                     status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    content={
-                        "error": {
-                            "code": "REQUEST_TOO_LARGE",
-                            "message": (
-                                f"Request body too large. Maximum size is {self.max_size_mb:.1f}MB"
-                            ),
-                            "max_size_bytes": self.max_size,
-                            "max_size_mb": self.max_size_mb,
-                        },
-                        "metadata": {
-                            "request_id": request_id,
-                            "status": "error",
-                        },
-                    },
+                    media_type="application/json",
                 )
+                await response(scope, receive, send)
+                return
+
+        if content_length is None and chunked:
+            await self.app(scope, self._capped_receive(receive), send)
+            return
 
         # Process request normally
-        return await call_next(request)
+        await self.app(scope, receive, send)
+
+    def _capped_receive(self, receive: Receive) -> Receive:
+        """Wrap ``receive`` to enforce the limit on a chunked body as it streams in.
+
+        Raises ``HTTPException(413)`` from the body read once the cumulative
+        size passes the limit; the app's exception handling turns that into the
+        response, and the connection stops draining the oversized body.
+        """
+        seen = 0
+
+        async def capped() -> Message:
+            nonlocal seen
+            message = await receive()
+            if message["type"] == "http.request":
+                seen += len(message.get("body", b""))
+                if seen > self.max_size:
+                    logger.warning(
+                        "Request rejected: chunked body exceeds limit of %d bytes (%.1fMB)",
+                        self.max_size,
+                        self.max_size_mb,
+                    )
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=(
+                            f"Request body too large. Maximum size is {self.max_size_mb:.1f}MB"
+                        ),
+                    )
+            return message
+
+        return capped
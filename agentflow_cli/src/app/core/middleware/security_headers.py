@@ -20,24 +20,53 @@ Configure via environment variables or settings:
 - CSP_POLICY: Custom CSP policy (default: strict policy)
 """
 
-from collections.abc import Callable
+import functools
+import zlib
+from typing import Literal
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to responses.
 
     This middleware enhances security by adding standard security headers
     that protect against common web vulnerabilities.
+
+    Implemented as a pure ASGI callable (not ``BaseHTTPMiddleware``) so each
+    request skips the anyio task group and response-streaming queue that
+    ``BaseHTTPMiddleware`` sets up; the headers are injected by wrapping
+    ``send`` and mutating the ``http.response.start`` message in place.
     """
 
+    # One instance lives for the app lifetime with several attributes read per
+    # response; slots keep those reads at fixed offsets and drop the __dict__.
+    __slots__ = (
+        "app",
+        "enable_hsts",
+        "hsts_max_age",
+        "hsts_include_subdomains",
+        "hsts_preload",
+        "frame_options",
+        "content_type_options",
+        "xss_protection",
+        "referrer_policy",
+        "permissions_policy",
+        "csp_policy",
+        "force_hsts",
+        "enable_etag",
+        "_static_headers",
+        "_hsts_value",
+        "_raw_headers",
+        "_raw_hsts",
+        "_hsts_static",
+        "_check_https",
+    )
+
     def __init__(  # noqa: PLR0913
         self,
-        app,
+        app: ASGIApp,
         enable_hsts: bool = True,
         hsts_max_age: int = 31536000,  # 1 year
         hsts_include_subdomains: bool = True,
@@ -48,6 +77,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         referrer_policy: str = "strict-origin-when-cross-origin",
         permissions_policy: str | None = None,
         csp_policy: str | None = None,
+        force_hsts: Literal["always", "never", "auto"] = "auto",
+        enable_etag: bool = False,
     ):
         """
         Initialize security headers middleware.
@@ -64,8 +95,14 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             referrer_policy: Referrer-Policy value
             permissions_policy: Permissions-Policy value (optional)
             csp_policy: Content-Security-Policy value (optional)
+            force_hsts: "always" sends HSTS unconditionally (TLS-terminating
+                load balancer), "never" suppresses it, "auto" (default) checks
+                the scheme / X-Forwarded-Proto per request
+            enable_etag: Emit a weak ETag on 200 GET responses and answer a
+                matching If-None-Match with 304 (opt-in; buffers GET response
+                bodies, so leave off for apps that stream GET responses)
         """
-        super().__init__(app)
+        self.app = app
         self.enable_hsts = enable_hsts
         self.hsts_max_age = hsts_max_age
         self.hsts_include_subdomains = hsts_include_subdomains
@@ -77,6 +114,39 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         self.permissions_policy = permissions_policy or self._default_permissions_policy()
         self.csp_policy = csp_policy or self._default_csp_policy()
 
+        # Every header except HSTS is fully static after construction, so build
+        # the (name, value) pairs and the HSTS value once here; dispatch just
+        # iterates and assigns instead of re-deriving them per response.
+        static_headers = [
+            ("X-Content-Type-Options", self.content_type_options),
+            ("X-Frame-Options", self.frame_options),
+            ("X-XSS-Protection", self.xss_protection),
+            ("Referrer-Policy", self.referrer_policy),
+        ]
+        if self.permissions_policy:
+            static_headers.append(("Permissions-Policy", self.permissions_policy))
+        if self.csp_policy:
+            static_headers.append(("Content-Security-Policy", self.csp_policy))
+        self._static_headers = tuple(static_headers)
+        self._hsts_value = self._build_hsts_header()
+
+        # Raw bytes form of the same headers for direct appending onto the
+        # http.response.start message; see _merge_headers for how they are
+        # combined with headers the app may have set itself.
+        self._raw_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in self._static_headers
+        ]
+        self._raw_hsts = (b"strict-transport-security", self._hsts_value.encode("latin-1"))
+
+        # Deployments behind a TLS-terminating load balancer are all-HTTPS (or
+        # all-plaintext), so the operator can hoist the per-request scheme check
+        # out of the hot path entirely.
+        self.force_hsts = force_hsts
+        self._hsts_static = enable_hsts and force_hsts == "always"
+        self._check_https = enable_hsts and force_hsts == "auto"
+        self.enable_etag = enable_etag
+
     def _default_permissions_policy(self) -> str:
         """
         Get default Permissions-Policy header value.
@@ -125,66 +195,128 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
         return "; ".join(hsts_parts)
 
-    def _is_https(self, request: Request) -> bool:
+    def _is_https(self, scope: Scope) -> bool:
         """
-        Check if request is using HTTPS.
+        Check if the connection is using HTTPS.
 
-        Checks both the request scheme and X-Forwarded-Proto header
+        Checks both the connection scheme and X-Forwarded-Proto header
         (for proxied requests).
 
         Args:
-            request: Starlette request object
+            scope: ASGI connection scope
 
         Returns:
             True if HTTPS, False otherwise
         """
-        # Check request scheme
-        if request.url.scheme == "https":
+        # Check connection scheme
+        if scope.get("scheme") == "https":
             return True
 
         # Check X-Forwarded-Proto header (for proxied requests)
-        forwarded_proto = request.headers.get("X-Forwarded-Proto", "")
-        return forwarded_proto.lower() == "https"
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-proto":
+                return value.decode("latin-1").lower() == "https"
+        return False
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process request and add security headers to response.
+        Process the connection and add security headers to the response.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-
-        Returns:
-            Response with security headers
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
-        # Process request
-        response = await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Add X-Content-Type-Options header
-        response.headers["X-Content-Type-Options"] = self.content_type_options
+        add_hsts = self._hsts_static or (self._check_https and self._is_https(scope))
 
-        # Add X-Frame-Options header
-        response.headers["X-Frame-Options"] = self.frame_options
+        if self.enable_etag and scope["method"] == "GET":
+            await self._call_with_etag(scope, receive, send, add_hsts)
+            return
 
-        # Add X-XSS-Protection header (for legacy browser support)
-        response.headers["X-XSS-Protection"] = self.xss_protection
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._merge_headers(message, add_hsts)
+            await send(message)
 
-        # Add Referrer-Policy header
-        response.headers["Referrer-Policy"] = self.referrer_policy
+        await self.app(scope, receive, send_with_headers)
 
-        # Add Permissions-Policy header
-        if self.permissions_policy:
-            response.headers["Permissions-Policy"] = self.permissions_policy
-
-        # Add Content-Security-Policy header
-        if self.csp_policy:
-            response.headers["Content-Security-Policy"] = self.csp_policy
-
-        # Add Strict-Transport-Security header (only for HTTPS)
-        if self.enable_hsts and self._is_https(request):
-            response.headers["Strict-Transport-Security"] = self._build_hsts_header()
+    def _merge_headers(self, message: Message, add_hsts: bool) -> None:
+        """Append the configured security headers to a start message.
 
-        return response
+        A header the app (or downstream middleware) already set wins -- a
+        route relaxing the CSP must not end up with two CSP headers, since
+        browsers enforce the intersection of multiple policies. One pass
+        collects the existing names; the common case (none of ours present)
+        then appends all of them in a single extend.
+        """
+        headers = message.setdefault("headers", [])
+        existing = {name for name, _ in headers}
+        headers.extend(pair for pair in self._raw_headers if pair[0] not in existing)
+        if add_hsts and self._raw_hsts[0] not in existing:
+            headers.append(self._raw_hsts)
+
+    async def _call_with_etag(
+        self, scope: Scope, receive: Receive, send: Send, add_hsts: bool
+    ) -> None:
+        """Run the inner app buffering the GET response to emit a weak ETag.
+
+        200 responses get ``ETag: W/"<len>-<crc32>"``; when the request's
+        If-None-Match equals it, the whole body is replaced by a 304. Non-200
+        responses are forwarded unchanged (with security headers applied).
+        """
+        start_message: Message | None = None
+        chunks: list[bytes] = []
+
+        async def buffering_send(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                self._merge_headers(message, add_hsts)
+                start_message = message
+                return
+            if message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if message.get("more_body"):
+                    return
+                await self._send_with_etag(scope, send, start_message, b"".join(chunks))
+                return
+            await send(message)
+
+        await self.app(scope, receive, buffering_send)
+
+    @staticmethod
+    async def _send_with_etag(
+        scope: Scope, send: Send, start_message: Message, body: bytes
+    ) -> None:
+        http_ok = 200
+        if start_message["status"] == http_ok:
+            etag = f'W/"{len(body)}-{zlib.crc32(body):08x}"'.encode("latin-1")
+            for name, value in scope["headers"]:
+                if name == b"if-none-match" and value == etag:
+                    # Carry the buffered headers over so the 304 keeps the
+                    # security headers and any caching directives; only the
+                    # body-specific ones are dropped (a 304 has no body).
+                    not_modified_headers = [
+                        (hname, hvalue)
+                        for hname, hvalue in start_message["headers"]
+                        if hname not in (b"content-length", b"content-type", b"transfer-encoding")
+                    ]
+                    not_modified_headers.append((b"etag", etag))
+                    await send(
+                        {
+                            "type": "http.response.start",
+                            "status": 304,
+                            "headers": not_modified_headers,
+                        }
+                    )
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+            start_message["headers"].append((b"etag", etag))
+        await send(start_message)
+        await send({"type": "http.response.body", "body": body})
 
 
 def create_security_headers_middleware(
@@ -198,11 +330,15 @@ def create_security_headers_middleware(
     referrer_policy: str = "strict-origin-when-cross-origin",
     permissions_policy: str | None = None,
     csp_policy: str | None = None,
-) -> type[SecurityHeadersMiddleware]:
+) -> functools.partial:
     """
     Factory function to create SecurityHeadersMiddleware with configuration.
 
     This is a convenience function for creating middleware with custom settings.
+    Prefer ``app.add_middleware(SecurityHeadersMiddleware, **options)`` directly
+    -- Starlette already threads keyword options through to ``__init__``. The
+    factory remains for callers that want a preconfigured callable and returns a
+    ``functools.partial`` instead of defining a throwaway subclass per call.
 
     Args:
         enable_hsts: Enable HSTS header
@@ -217,23 +353,18 @@ def create_security_headers_middleware(
         csp_policy: Content-Security-Policy value
 
     Returns:
-        Configured SecurityHeadersMiddleware class
+        ``functools.partial`` that builds a configured SecurityHeadersMiddleware
     """
-
-    class ConfiguredSecurityHeadersMiddleware(SecurityHeadersMiddleware):
-        def __init__(self, app):
-            super().__init__(
-                app,
-                enable_hsts=enable_hsts,
-                hsts_max_age=hsts_max_age,
-                hsts_include_subdomains=hsts_include_subdomains,
-                hsts_preload=hsts_preload,
-                frame_options=frame_options,
-                content_type_options=content_type_options,
-                xss_protection=xss_protection,
-                referrer_policy=referrer_policy,
-                permissions_policy=permissions_policy,
-                csp_policy=csp_policy,
-            )
-
-    return ConfiguredSecurityHeadersMiddleware
+    return functools.partial(
+        SecurityHeadersMiddleware,
+        enable_hsts=enable_hsts,
+        hsts_max_age=hsts_max_age,
+        hsts_include_subdomains=hsts_include_subdomains,
+        hsts_preload=hsts_preload,
+        frame_options=frame_options,
+        content_type_options=content_type_options,
+        xss_protection=xss_protection,
+        referrer_policy=referrer_policy,
+        permissions_policy=permissions_policy,
+        csp_policy=csp_policy,
+    )
@@ -7,6 +7,7 @@ preventing tokens, passwords, and other credentials from appearing in logs.
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
 
@@ -33,11 +34,89 @@ SENSITIVE_PATTERNS = {
     "credit_card",
 }
 
-# Regex pattern to detect JWT tokens (three base64url parts separated by dots)
-JWT_PATTERN = re.compile(r"^[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*$")
+# All sensitive patterns joined into one alternation so a key costs a single
+# C-level regex search instead of one Python-level substring scan per pattern.
+# Sorted longest-first so overlapping alternatives prefer the specific match.
+# IGNORECASE lets the engine match the original key directly, skipping the
+# per-key str.lower() allocation (the patterns are all lowercase ASCII).
+_SENSITIVE_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(SENSITIVE_PATTERNS, key=len, reverse=True)),
+    re.IGNORECASE | re.ASCII,
+)
+
+# Optional Aho-Corasick automaton for the sensitive-key scan: a single pass over
+# the key matches all patterns at once, which beats even the combined regex on
+# large header dumps. Falls back to the regex when pyahocorasick isn't installed
+# (cache misses are rare either way thanks to the lru_cache below).
+try:
+    import ahocorasick
+
+    _SENSITIVE_AC = ahocorasick.Automaton()
+    for _pattern in SENSITIVE_PATTERNS:
+        _SENSITIVE_AC.add_word(_pattern, _pattern)
+    _SENSITIVE_AC.make_automaton()
+except ImportError:
+    _SENSITIVE_AC = None
+
+
+if _SENSITIVE_AC is not None:
+
+    @lru_cache(maxsize=2048)
+    def _key_is_sensitive(key: str) -> bool:
+        """Memoized sensitive-key check backed by the Aho-Corasick automaton."""
+        return next(_SENSITIVE_AC.iter(key.lower()), None) is not None
+
+else:
+
+    @lru_cache(maxsize=2048)
+    def _key_is_sensitive(key: str) -> bool:
+        """Memoized sensitive-key check: log payloads reuse a bounded vocabulary
+        of field names, so after warmup each key costs one cache lookup instead
+        of a regex scan (case folding happens inside the engine, allocation-free)."""
+        return _SENSITIVE_RE.search(key) is not None
+
+
+# Types that can never carry sensitive content: skip the traversal machinery
+# for them entirely (the overwhelmingly common args to logger calls).
+_SAFE_TYPES = frozenset({int, float, bool, type(None), bytes, bytearray})
+
+# Shortest string _sanitize_string can ever redact: "Bearer " plus one token
+# character. Anything shorter is returned untouched without running any checks.
+_MIN_SANITIZABLE_LEN = 8
+
+# Regex pattern to detect JWT tokens (three base64url parts separated by dots).
+# re.ASCII keeps the engine on the byte-level fast path (the classes are ASCII anyway).
+JWT_PATTERN = re.compile(r"^[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*$", re.ASCII)
 
 # Regex pattern to detect bearer tokens
-BEARER_PATTERN = re.compile(r"^Bearer\s+[A-Za-z0-9\-_.~+/]+=*$", re.IGNORECASE)
+BEARER_PATTERN = re.compile(r"^Bearer\s+[A-Za-z0-9\-_.~+/]+=*$", re.IGNORECASE | re.ASCII)
+
+
+def _walk_dict(value: dict, child_depth: int, dst: Any, slot: Any, stack: list, _fixups: list):
+    new_dict: dict = {}
+    dst[slot] = new_dict
+    for k, v in value.items():
+        new_dict[k] = None
+        stack.append((v, child_depth, new_dict, k, k))
+
+
+def _walk_list(value: list, child_depth: int, dst: Any, slot: Any, stack: list, _fixups: list):
+    new_list: list = [None] * len(value)
+    dst[slot] = new_list
+    for index, item in enumerate(value):
+        stack.append((item, child_depth, new_list, index, None))
+
+
+def _walk_tuple(value: tuple, child_depth: int, dst: Any, slot: Any, stack: list, fixups: list):
+    build: list = [None] * len(value)
+    fixups.append((dst, slot, build))
+    for index, item in enumerate(value):
+        stack.append((item, child_depth, build, index, None))
+
+
+# Exact-type container dispatch for the traversal loop; subclasses fall back to
+# the isinstance chain inside sanitize_for_logging.
+_CONTAINER_DISPATCH = {dict: _walk_dict, list: _walk_list, tuple: _walk_tuple}
 
 
 def sanitize_for_logging(data: Any, max_depth: int = 10, _current_depth: int = 0) -> Any:
@@ -66,19 +145,63 @@ def sanitize_for_logging(data: Any, max_depth: int = 10, _current_depth: int = 0
         >>> sanitize_for_logging({"Authorization": "Bearer eyJhbGc..."})
         {'Authorization': '***REDACTED***'}
     """
-    # Prevent excessive recursion
-    if _current_depth >= max_depth:
-        return "***MAX_DEPTH_REACHED***"
-
-    if isinstance(data, dict):
-        return {k: _sanitize_value(k, v, max_depth, _current_depth + 1) for k, v in data.items()}
-    if isinstance(data, list):
-        return [sanitize_for_logging(item, max_depth, _current_depth + 1) for item in data]
-    if isinstance(data, tuple):
-        return tuple(sanitize_for_logging(item, max_depth, _current_depth + 1) for item in data)
-    if isinstance(data, str):
-        return _sanitize_string(data)
-    return data
+    # Primitive scalars can never be sensitive -- return them before any setup
+    if type(data) in _SAFE_TYPES:
+        return data
+
+    # Iterative worklist traversal: one loop iteration per node instead of one
+    # Python frame per node, so deeply nested payloads cost no call overhead.
+    root: list[Any] = [None]
+    # Entries are (value, depth, destination container, slot in it, dict key or None).
+    stack: list[tuple[Any, int, Any, Any, str | None]] = [(data, _current_depth, root, 0, None)]
+    # Tuples are built as mutable lists and converted after their children are
+    # placed; recorded parent-first, converted child-first (reverse order).
+    tuple_fixups: list[tuple[Any, Any, list]] = []
+
+    while stack:
+        value, depth, dst, slot, key = stack.pop()
+
+        # Dictionary values whose key name is sensitive are redacted outright.
+        if key is not None and _key_is_sensitive(key):
+            dst[slot] = "***REDACTED***"
+            continue
+
+        # Prevent excessive recursion
+        if depth >= max_depth:
+            dst[slot] = "***MAX_DEPTH_REACHED***"
+            continue
+
+        value_type = type(value)
+        if value_type is str:
+            # Inlined fast path: most logged strings are short and can never be
+            # redacted, so skip the _sanitize_string call entirely for them.
+            dst[slot] = value if len(value) < _MIN_SANITIZABLE_LEN else _sanitize_string(value)
+            continue
+
+        # Exact-type dispatch: one dict probe on type(value) instead of an
+        # isinstance chain (which walks the MRO per check).
+        handler = _CONTAINER_DISPATCH.get(value_type)
+        if handler is None:
+            # Subclasses of the container types are rare in log payloads but
+            # must still be walked; resolve them the slow isinstance way.
+            if isinstance(value, dict):
+                handler = _walk_dict
+            elif isinstance(value, list):
+                handler = _walk_list
+            elif isinstance(value, tuple):
+                handler = _walk_tuple
+            elif isinstance(value, str):
+                dst[slot] = _sanitize_string(value)
+                continue
+            else:
+                dst[slot] = value
+                continue
+        handler(value, depth + 1, dst, slot, stack, tuple_fixups)
+
+    for dst, slot, build in reversed(tuple_fixups):
+        dst[slot] = tuple(build)
+
+    return root[0]
 
 
 def _sanitize_value(key: str, value: Any, max_depth: int, current_depth: int) -> Any:
@@ -94,9 +217,8 @@ def _sanitize_value(key: str, value: Any, max_depth: int, current_depth: int) ->
     Returns:
         Sanitized value
     """
-    # Check if key name contains sensitive patterns
-    key_lower = key.lower()
-    if any(pattern in key_lower for pattern in SENSITIVE_PATTERNS):
+    # Check if key name contains sensitive patterns (memoized per key string)
+    if _key_is_sensitive(key):
         return "***REDACTED***"
 
     # Recursively sanitize the value
@@ -113,13 +235,19 @@ def _sanitize_string(value: str) -> str:
     Returns:
         Original string or redaction marker
     """
+    # Too short to be a JWT, bearer token, or long random token
+    if len(value) < _MIN_SANITIZABLE_LEN:
+        return value
+
     max_value = 32
-    # Check for JWT token pattern
-    if len(value) > max_value and JWT_PATTERN.match(value):
+    # Check for JWT token pattern. Cheap structural prefilter first: a JWT always
+    # contains a dot, and almost no ordinary log string of this length does, so
+    # the regex only runs on plausible candidates.
+    if len(value) > max_value and "." in value and JWT_PATTERN.match(value):
         return "***JWT_TOKEN***"
 
-    # Check for Bearer token pattern
-    if BEARER_PATTERN.match(value):
+    # Check for Bearer token pattern (prefix prefilter before the regex)
+    if value[:6].lower() == "bearer" and BEARER_PATTERN.match(value):
         return "***BEARER_TOKEN***"
 
     # Check if string looks like a long random token (>32 chars, alphanumeric)
@@ -157,31 +285,21 @@ def sanitize_log_message(message: str, *args: Any, **kwargs: Any) -> tuple[str,
 
 class SanitizingFormatter(logging.Formatter):
     """
-    A wrapper for log formatters that sanitizes sensitive data.
+    A ``logging.Formatter`` that sanitizes sensitive data.
 
-    This can be used to wrap existing formatters to add sanitization. It is a
-    proper ``logging.Formatter`` subclass so it can be passed to
-    ``Handler.setFormatter`` without type errors, while delegating the actual
-    formatting to the wrapped base formatter.
+    This is a direct ``logging.Formatter`` subclass (constructed with the usual
+    ``fmt``/``datefmt``/``style`` arguments) rather than a wrapper around a base
+    formatter, so each record pays one ``super().format`` call instead of an
+    extra Python-level delegation hop, and it passes any ``isinstance`` checks
+    handlers perform.
 
     Example:
         import logging
 
-        formatter = logging.Formatter('%(asctime)s - %(message)s')
-        sanitizing_formatter = SanitizingFormatter(formatter)
-        handler.setFormatter(sanitizing_formatter)
+        formatter = SanitizingFormatter('%(asctime)s - %(message)s')
+        handler.setFormatter(formatter)
     """
 
-    def __init__(self, base_formatter: logging.Formatter) -> None:
-        """
-        Initialize the sanitizing formatter.
-
-        Args:
-            base_formatter: The underlying formatter to wrap
-        """
-        super().__init__()
-        self.base_formatter = base_formatter
-
     def format(self, record: logging.LogRecord) -> str:
         """
         Format the log record with sanitization.
@@ -193,8 +311,19 @@ class SanitizingFormatter(logging.Formatter):
             Formatted and sanitized log string
         """
         # Sanitize the message arguments
-        if record.args:
-            record.args = tuple(sanitize_for_logging(arg) for arg in record.args)
-
-        # Format using the base formatter
-        return self.base_formatter.format(record)
+        args = record.args
+        if args:
+            if isinstance(args, dict):
+                # logging's %(name)s mapping style passes a single dict as args;
+                # sanitize it directly instead of iterating its keys.
+                record.args = sanitize_for_logging(args)
+            else:
+                sanitized = tuple(
+                    arg if type(arg) in _SAFE_TYPES else sanitize_for_logging(arg) for arg in args
+                )
+                # Only swap the tuple in when something actually changed -- in
+                # the steady state every arg comes back identity-equal.
+                if any(new is not old for new, old in zip(sanitized, args, strict=False)):
+                    record.args = sanitized
+
+        return super().format(record)
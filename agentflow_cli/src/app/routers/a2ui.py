@@ -1,362 +1,469 @@
-# """
-# Agent-to-UI (A2UI) WebSocket API Endpoints
+"""
+Agent-to-UI (A2UI) WebSocket API Endpoints
 
-# Provides real-time communication from agents to the UI using WebSockets.
-# """
+Provides real-time communication from agents to the UI using WebSockets.
 
-# import asyncio
-# import json
-# import logging
-# from datetime import datetime, timezone
-# from typing import Any
-
-# from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
-# from pydantic import BaseModel
-
-# logger = logging.getLogger(__name__)
-
-# router = APIRouter(tags=["A2UI"])
-
-
-# class ConnectionManager:
-#     """Manages WebSocket connections for A2UI."""
-
-#     def __init__(self):
-#         self.active_connections: dict[str, list[WebSocket]] = {}
-
-#     async def connect(self, websocket: WebSocket, agent_id: str):
-#         """Connect a client to an agent's updates."""
-#         await websocket.accept()
-
-#         if agent_id not in self.active_connections:
-#             self.active_connections[agent_id] = []
-
-#         self.active_connections[agent_id].append(websocket)
-#         logger.info(
-#             f"Client connected to agent {agent_id}. "
-#             f"Total connections: {len(self.active_connections[agent_id])}"
-#         )
-
-#     def disconnect(self, websocket: WebSocket, agent_id: str):
-#         """Disconnect a client from an agent's updates."""
-#         if agent_id in self.active_connections:
-#             if websocket in self.active_connections[agent_id]:
-#                 self.active_connections[agent_id].remove(websocket)
-
-#                 if not self.active_connections[agent_id]:
-#                     del self.active_connections[agent_id]
-
-#                 logger.info(
-#                     f"Client disconnected from agent {agent_id}. "
-#                     f"Remaining connections: "
-#                     f"{len(self.active_connections.get(agent_id, []))}"
-#                 )
-
-#     async def send_to_agent_subscribers(
-#         self,
-#         agent_id: str,
-#         message: dict[str, Any],
-#     ):
-#         """Send message to all subscribers of an agent."""
-#         if agent_id not in self.active_connections:
-#             return
-
-#         # Send to all connected clients
-#         disconnected = []
-#         for connection in self.active_connections[agent_id]:
-#             try:
-#                 await connection.send_json(message)
-#             except Exception as e:
-#                 logger.error(f"Error sending message: {e}")
-#                 disconnected.append(connection)
-
-#         # Clean up disconnected clients
-#         for connection in disconnected:
-#             self.disconnect(connection, agent_id)
-
-#     async def broadcast(self, message: dict[str, Any]):
-#         """Broadcast message to all connected clients."""
-#         for agent_id in list(self.active_connections.keys()):
-#             await self.send_to_agent_subscribers(agent_id, message)
-
-#     def get_connection_count(self, agent_id: str | None = None) -> int:
-#         """Get number of active connections."""
-#         if agent_id:
-#             return len(self.active_connections.get(agent_id, []))
-#         return sum(len(conns) for conns in self.active_connections.values())
-
-
-# # Global connection manager
-# manager = ConnectionManager()
-
-
-# class A2UIMessage(BaseModel):
-#     """A2UI message structure."""
-
-#     message_type: str
-#     agent_id: str
-#     timestamp: str
-#     data: dict[str, Any]
-
-
-# @router.websocket("/ws/agents/{agent_id}")
-# async def websocket_agent_updates(
-#     websocket: WebSocket,
-#     agent_id: str,
-#     token: str | None = Query(None),
-# ):
-#     """
-#     WebSocket endpoint for real-time agent updates.
-
-#     Clients connect to this endpoint to receive real-time updates from a specific agent.
-#     Use '*' as agent_id to receive updates from all agents.
-#     """
-#     # TODO: Implement authentication using token
-#     # For now, accept all connections
-
-#     try:
-#         await manager.connect(websocket, agent_id)
-
-#         # Send welcome message
-#         welcome_message = A2UIMessage(
-#             message_type="CONNECTED",
-#             agent_id=agent_id,
-#             timestamp=datetime.now(timezone.utc).isoformat(),
-#             data={"message": f"Connected to agent {agent_id} updates"},
-#         )
-#         await websocket.send_json(welcome_message.model_dump())
-
-#         # Keep connection alive and handle incoming messages
-#         while True:
-#             try:
-#                 # Wait for messages from client (e.g., ping, subscription changes)
-#                 data = await websocket.receive_text()
-
-#                 # Handle client messages if needed
-#                 try:
-#                     client_msg = json.loads(data)
-#                     if client_msg.get("type") == "ping":
-#                         await websocket.send_json({"type": "pong"})
-#                 except json.JSONDecodeError:
-#                     logger.warning(f"Invalid JSON received: {data}")
-
-#             except WebSocketDisconnect:
-#                 break
-#             except Exception as e:
-#                 logger.error(f"Error in WebSocket loop: {e}")
-#                 break
-
-#     except Exception as e:
-#         logger.error(f"WebSocket error: {e}")
-#     finally:
-#         manager.disconnect(websocket, agent_id)
-
-
-# @router.post("/api/v1/a2ui/send")
-# async def send_agent_update(
-#     agent_id: str,
-#     message_type: str,
-#     data: dict[str, Any],
-# ):
-#     """
-#     Send an update from an agent to all subscribed UI clients.
-
-#     This endpoint is called by agents to push updates to connected UIs.
-#     """
-#     try:
-#         message = A2UIMessage(
-#             message_type=message_type,
-#             agent_id=agent_id,
-#             timestamp=datetime.now(timezone.utc).isoformat(),
-#             data=data,
-#         )
-
-#         await manager.send_to_agent_subscribers(agent_id, message.model_dump())
-
-#         # Also send to wildcard subscribers (agent_id = "*")
-#         if agent_id != "*":
-#             await manager.send_to_agent_subscribers("*", message.model_dump())
-
-#         return {
-#             "success": True,
-#             "message": "Update sent to subscribers",
-#             "subscriber_count": manager.get_connection_count(agent_id),
-#         }
-
-#     except Exception as e:
-#         logger.error(f"Error sending agent update: {e}")
-#         return {"success": False, "error": str(e)}
-
-
-# @router.post("/api/v1/a2ui/broadcast")
-# async def broadcast_update(
-#     message_type: str,
-#     data: dict[str, Any],
-#     sender_id: str = "system",
-# ):
-#     """
-#     Broadcast an update to all connected UI clients.
-
-#     This is useful for system-wide notifications.
-#     """
-#     try:
-#         message = A2UIMessage(
-#             message_type=message_type,
-#             agent_id=sender_id,
-#             timestamp=datetime.now(timezone.utc).isoformat(),
-#             data=data,
-#         )
-
-#         await manager.broadcast(message.model_dump())
-
-#         return {
-#             "success": True,
-#             "message": "Broadcast sent to all subscribers",
-#             "total_connections": manager.get_connection_count(),
-#         }
-
-#     except Exception as e:
-#         logger.error(f"Error broadcasting update: {e}")
-#         return {"success": False, "error": str(e)}
-
-
-# @router.get("/api/v1/a2ui/connections")
-# async def get_connection_stats(agent_id: str | None = None):
-#     """Get statistics about active WebSocket connections."""
-#     if agent_id:
-#         count = manager.get_connection_count(agent_id)
-#         return {
-#             "agent_id": agent_id,
-#             "connection_count": count,
-#         }
-#     else:
-#         return {
-#             "total_connections": manager.get_connection_count(),
-#             "agents": {
-#                 aid: len(conns)
-#                 for aid, conns in manager.active_connections.items()
-#             },
-#         }
-
-
-# # Helper function for agents to send updates
-# async def send_agent_status_update(
-#     agent_id: str,
-#     status: str,
-#     message: str | None = None,
-#     metadata: dict[str, Any] | None = None,
-# ):
-#     """Helper to send agent status update."""
-#     data = {"status": status}
-#     if message:
-#         data["message"] = message
-#     if metadata:
-#         data["metadata"] = metadata
-
-#     await manager.send_to_agent_subscribers(
-#         agent_id,
-#         A2UIMessage(
-#             message_type="AGENT_STATUS",
-#             agent_id=agent_id,
-#             timestamp=datetime.now(timezone.utc).isoformat(),
-#             data=data,
-#         ).model_dump(),
-#     )
-
-
-# async def send_agent_message(
-#     agent_id: str,
-#     content: str,
-#     role: str,
-#     message_id: str | None = None,
-#     metadata: dict[str, Any] | None = None,
-# ):
-#     """Helper to send agent message update."""
-#     data = {"content": content, "role": role}
-#     if message_id:
-#         data["message_id"] = message_id
-#     if metadata:
-#         data["metadata"] = metadata
-
-#     await manager.send_to_agent_subscribers(
-#         agent_id,
-#         A2UIMessage(
-#             message_type="AGENT_MESSAGE",
-#             agent_id=agent_id,
-#             timestamp=datetime.now(timezone.utc).isoformat(),
-#             data=data,
-#         ).model_dump(),
-#     )
-
-
-# async def send_agent_thinking(
-#     agent_id: str,
-#     thinking: str,
-#     step: str | None = None,
-#     metadata: dict[str, Any] | None = None,
-# ):
-#     """Helper to send agent thinking update."""
-#     data = {"thinking": thinking}
-#     if step:
-#         data["step"] = step
-#     if metadata:
-#         data["metadata"] = metadata
-
-#     await manager.send_to_agent_subscribers(
-#         agent_id,
-#         A2UIMessage(
-#             message_type="AGENT_THINKING",
-#             agent_id=agent_id,
-#             timestamp=datetime.now(timezone.utc).isoformat(),
-#             data=data,
-#         ).model_dump(),
-#     )
-
-
-# async def send_agent_error(
-#     agent_id: str,
-#     error: str,
-#     error_code: str | None = None,
-#     metadata: dict[str, Any] | None = None,
-# ):
-#     """Helper to send agent error update."""
-#     data = {"error": error}
-#     if error_code:
-#         data["error_code"] = error_code
-#     if metadata:
-#         data["metadata"] = metadata
-
-#     await manager.send_to_agent_subscribers(
-#         agent_id,
-#         A2UIMessage(
-#             message_type="AGENT_ERROR",
-#             agent_id=agent_id,
-#             timestamp=datetime.now(timezone.utc).isoformat(),
-#             data=data,
-#         ).model_dump(),
-#     )
-
-
-# async def send_agent_complete(
-#     agent_id: str,
-#     result: Any,
-#     duration: float | None = None,
-#     metadata: dict[str, Any] | None = None,
-# ):
-#     """Helper to send agent completion update."""
-#     data = {"result": result}
-#     if duration:
-#         data["duration"] = duration
-#     if metadata:
-#         data["metadata"] = metadata
-
-#     await manager.send_to_agent_subscribers(
-#         agent_id,
-#         A2UIMessage(
-#             message_type="AGENT_COMPLETE",
-#             agent_id=agent_id,
-#             timestamp=datetime.now(timezone.utc).isoformat(),
-#             data=data,
-#         ).model_dump(),
-#     )
+Note: this router is not mounted in ``setup_router.init_routes`` yet; it is
+importable for apps that want to wire it up themselves.
+"""
 
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel
+
+from agentflow_cli.src.app.core.auth.permissions import (
+    RequirePermission,
+    ws_bearer_subprotocol,
+)
+
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["A2UI"])
+
+# Pong frames are identical for every client; encode once at import time.
+_PONG_BYTES = b'{"type":"pong"}'
+
+# Number of sub-dicts the connection map is split across (power of two so the
+# shard pick is a mask). Keeps each dict small under heavy connect/disconnect
+# churn with many distinct agent ids.
+_SHARD_COUNT = 16
+
+# Bound on each subscriber's outbound queue. A slow client caps out here and
+# starts losing its oldest updates instead of growing memory without bound or
+# stalling the fan-out for everyone else.
+_QUEUE_MAXSIZE = 1024
+
+
+class _Subscriber:
+    """One connected client: its websocket, outbound queue, and writer task."""
+
+    __slots__ = ("websocket", "queue", "task", "dropped")
+
+    def __init__(self, websocket: WebSocket, queue: asyncio.Queue, task: asyncio.Task):
+        self.websocket = websocket
+        self.queue = queue
+        self.task = task
+        self.dropped = 0
+
+
+# Formatted-timestamp cache at millisecond resolution: a burst of M agent
+# tokens within the same millisecond pays one datetime allocation + isoformat
+# instead of M. (key, value); key is time.monotonic() truncated to ms.
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO string, cached per millisecond."""
+    global _ts_cache  # noqa: PLW0603
+    key = int(time.monotonic() * 1000)
+    if _ts_cache[0] != key:
+        _ts_cache = (key, datetime.now(UTC).isoformat())
+    return _ts_cache[1]
+
+
+def _encode(message_type: str, agent_id: str, data: dict[str, Any]) -> bytes:
+    """Encode an outbound A2UI message straight to JSON bytes.
+
+    This is the write-only hot path: the shape is fixed (see ``A2UIMessage``),
+    so a single ``orjson.dumps`` replaces Pydantic model construction +
+    ``model_dump`` + a second stdlib-json encode inside ``send_json``.
+    """
+    return orjson.dumps(
+        {
+            "message_type": message_type,
+            "agent_id": agent_id,
+            "timestamp": _now_iso(),
+            "data": data,
+        }
+    )
+
+
+class ConnectionManager:
+    """Manages WebSocket connections for A2UI.
+
+    Each connection gets an outbound ``asyncio.Queue`` drained by a dedicated
+    writer task. Fan-out is a synchronous ``put_nowait`` per subscriber -- no
+    awaits in the loop -- and the writer batches every message already queued
+    into a single websocket frame (a JSON array when more than one message is
+    pending), so a burst of N agent updates costs one serialize + one write
+    per connection instead of N.
+
+    Messages enter the manager as pre-encoded JSON bytes (see ``_encode``),
+    so fan-out to N subscribers serializes once, not N times.
+    """
+
+    def __init__(self):
+        # Agent ids are sharded across fixed sub-dicts so connect/disconnect
+        # churn touches one small dict instead of a single map holding every
+        # agent. Each shard value is keyed by websocket so disconnect is a
+        # single hash probe -- batches of teardowns after a failed broadcast
+        # stay O(1) per connection even with thousands of wildcard subscribers.
+        self._shards: tuple[dict[str, dict[WebSocket, _Subscriber]], ...] = tuple(
+            {} for _ in range(_SHARD_COUNT)
+        )
+        # Maintained on connect/disconnect so the total count (reported on
+        # every /send response) is O(1) instead of a sum over all agents.
+        self._total_count = 0
+
+    def _shard(self, agent_id: str) -> dict[str, dict[WebSocket, _Subscriber]]:
+        return self._shards[hash(agent_id) & (_SHARD_COUNT - 1)]
+
+    @property
+    def active_connections(self) -> dict[str, dict[WebSocket, _Subscriber]]:
+        """Merged view over all shards (stats/introspection, not hot paths)."""
+        merged: dict[str, dict[WebSocket, _Subscriber]] = {}
+        for shard in self._shards:
+            merged.update(shard)
+        return merged
+
+    async def connect(self, websocket: WebSocket, agent_id: str, subprotocol: str | None = None):
+        """Connect a client to an agent's updates."""
+        await websocket.accept(subprotocol=subprotocol)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        task = asyncio.create_task(self._writer_loop(websocket, queue, agent_id))
+        subscriber = _Subscriber(websocket, queue, task)
+
+        shard = self._shard(agent_id)
+        shard.setdefault(agent_id, {})[websocket] = subscriber
+        self._total_count += 1
+        logger.info(
+            "Client connected to agent %s. Total connections: %d",
+            agent_id,
+            len(shard[agent_id]),
+        )
+
+    def disconnect(self, websocket: WebSocket, agent_id: str):
+        """Disconnect a client from an agent's updates."""
+        shard = self._shard(agent_id)
+        subscribers = shard.get(agent_id)
+        if not subscribers:
+            return
+
+        subscriber = subscribers.pop(websocket, None)
+        if subscriber is None:
+            return
+        subscriber.task.cancel()
+        self._total_count -= 1
+
+        if not subscribers:
+            del shard[agent_id]
+
+        logger.info(
+            "Client disconnected from agent %s. Remaining connections: %d",
+            agent_id,
+            len(shard.get(agent_id, ())),
+        )
+
+    async def _writer_loop(self, websocket: WebSocket, queue: asyncio.Queue, agent_id: str):
+        """Drain the queue and write each burst as a single frame.
+
+        Blocks on the first message, then collects everything else already
+        queued via ``get_nowait`` so a burst collapses into one send. Queue
+        items are already-encoded JSON bytes, so batching is a byte join.
+        """
+        try:
+            while True:
+                batch = [await queue.get()]
+                while True:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                payload = batch[0] if len(batch) == 1 else b"[" + b",".join(batch) + b"]"
+                await websocket.send_bytes(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Error sending message: %s", e)
+            self.disconnect(websocket, agent_id)
+
+    def send_to_agent_subscribers(
+        self,
+        agent_id: str,
+        payload: bytes,
+    ):
+        """Queue an encoded message for all subscribers of an agent (synchronous)."""
+        subscribers = self._shard(agent_id).get(agent_id)
+        if not subscribers:
+            return
+
+        for subscriber in subscribers.values():
+            self._enqueue(subscriber, payload)
+
+    @staticmethod
+    def _enqueue(subscriber: _Subscriber, payload: bytes):
+        """Queue a payload, dropping the subscriber's oldest message when full.
+
+        A consumer that can't keep up loses its stalest update rather than
+        blocking the publisher or accumulating unbounded backlog.
+        """
+        try:
+            subscriber.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            with contextlib.suppress(asyncio.QueueEmpty):
+                subscriber.queue.get_nowait()
+            subscriber.queue.put_nowait(payload)
+            subscriber.dropped += 1
+            if subscriber.dropped == 1 or subscriber.dropped % 1000 == 0:
+                logger.warning(
+                    "Slow A2UI client: dropped %d message(s) for a subscriber",
+                    subscriber.dropped,
+                )
+
+    def broadcast(self, payload: bytes):
+        """Broadcast an encoded message to all connected clients.
+
+        Iterates the shard values directly -- the fan-out contains no awaits,
+        so nothing can mutate the maps mid-loop and no key snapshot (or
+        repeated agent-id lookup) is needed.
+        """
+        for shard in self._shards:
+            for subscribers in shard.values():
+                for subscriber in subscribers.values():
+                    self._enqueue(subscriber, payload)
+
+    def get_connection_count(self, agent_id: str | None = None) -> int:
+        """Get number of active connections."""
+        if agent_id:
+            return len(self._shard(agent_id).get(agent_id, ()))
+        return self._total_count
+
+
+# Global connection manager
+manager = ConnectionManager()
+
+
+class A2UIMessage(BaseModel):
+    """A2UI message structure.
+
+    Documents the outbound wire shape; the send paths encode it directly
+    via ``_encode`` rather than constructing this model per message.
+    """
+
+    message_type: str
+    agent_id: str
+    timestamp: str
+    data: dict[str, Any]
+
+
+@router.websocket("/ws/agents/{agent_id}")
+async def websocket_agent_updates(
+    websocket: WebSocket,
+    agent_id: str,
+    user: dict[str, Any] = Depends(RequirePermission("a2ui", "stream")),
+):
+    """
+    WebSocket endpoint for real-time agent updates.
+
+    Clients connect to this endpoint to receive real-time updates from a specific agent.
+    Use '*' as agent_id to receive updates from all agents.
+
+    Auth: ``RequirePermission("a2ui", "stream")`` — bearer via the ``Authorization``
+    header, the ``agentflow-bearer`` Sec-WebSocket-Protocol (browser-safe), or the
+    ``?token=`` query fallback.
+    """
+    try:
+        await manager.connect(websocket, agent_id, subprotocol=ws_bearer_subprotocol(websocket))
+
+        # Send welcome message
+        await websocket.send_bytes(
+            _encode("CONNECTED", agent_id, {"message": f"Connected to agent {agent_id} updates"})
+        )
+
+        # Keep connection alive and handle incoming messages
+        while True:
+            try:
+                # Wait for messages from client (e.g., ping, subscription changes)
+                data = await websocket.receive_text()
+
+                # Handle client messages if needed. Keepalive pings dominate
+                # inbound frames, so a prefix check skips JSON parsing for
+                # them entirely; anything else goes through orjson.
+                try:
+                    if data.startswith(('{"type":"ping"', '{"type": "ping"')):
+                        await websocket.send_bytes(_PONG_BYTES)
+                    else:
+                        client_msg = orjson.loads(data)
+                        if client_msg.get("type") == "ping":
+                            await websocket.send_bytes(_PONG_BYTES)
+                except orjson.JSONDecodeError:
+                    logger.warning("Invalid JSON received: %s", data)
+
+            except WebSocketDisconnect:
+                break
+            except Exception as e:
+                logger.error("Error in WebSocket loop: %s", e)
+                break
+
+    except Exception as e:
+        logger.error("WebSocket error: %s", e)
+    finally:
+        manager.disconnect(websocket, agent_id)
+
+
+@router.post("/api/v1/a2ui/send")
+async def send_agent_update(
+    agent_id: str,
+    message_type: str,
+    data: dict[str, Any],
+    user: dict[str, Any] = Depends(RequirePermission("a2ui", "send")),
+):
+    """
+    Send an update from an agent to all subscribed UI clients.
+
+    This endpoint is called by agents to push updates to connected UIs.
+    """
+    try:
+        payload = _encode(message_type, agent_id, data)
+
+        manager.send_to_agent_subscribers(agent_id, payload)
+
+        # Also send to wildcard subscribers (agent_id = "*")
+        if agent_id != "*":
+            manager.send_to_agent_subscribers("*", payload)
+
+        return {
+            "success": True,
+            "message": "Update sent to subscribers",
+            "subscriber_count": manager.get_connection_count(agent_id),
+        }
+
+    except Exception as e:
+        logger.error("Error sending agent update: %s", e)
+        return {"success": False, "error": str(e)}
+
+
+@router.post("/api/v1/a2ui/broadcast")
+async def broadcast_update(
+    message_type: str,
+    data: dict[str, Any],
+    sender_id: str = "system",
+    user: dict[str, Any] = Depends(RequirePermission("a2ui", "broadcast")),
+):
+    """
+    Broadcast an update to all connected UI clients.
+
+    This is useful for system-wide notifications.
+    """
+    try:
+        manager.broadcast(_encode(message_type, sender_id, data))
+
+        return {
+            "success": True,
+            "message": "Broadcast sent to all subscribers",
+            "total_connections": manager.get_connection_count(),
+        }
+
+    except Exception as e:
+        logger.error("Error broadcasting update: %s", e)
+        return {"success": False, "error": str(e)}
+
+
+@router.get("/api/v1/a2ui/connections")
+async def get_connection_stats(
+    agent_id: str | None = None,
+    user: dict[str, Any] = Depends(RequirePermission("a2ui", "read")),
+):
+    """Get statistics about active WebSocket connections."""
+    if agent_id:
+        count = manager.get_connection_count(agent_id)
+        return {
+            "agent_id": agent_id,
+            "connection_count": count,
+        }
+    return {
+        "total_connections": manager.get_connection_count(),
+        "agents": {aid: len(subs) for aid, subs in manager.active_connections.items()},
+    }
+
+
+# Helper function for agents to send updates
+async def send_agent_status_update(
+    agent_id: str,
+    status: str,
+    message: str | None = None,
+    metadata: dict[str, Any] | None = None,
+):
+    """Helper to send agent status update."""
+    data: dict[str, Any] = {"status": status}
+    if message:
+        data["message"] = message
+    if metadata:
+        data["metadata"] = metadata
+
+    manager.send_to_agent_subscribers(agent_id, _encode("AGENT_STATUS", agent_id, data))
+
+
+async def send_agent_message(
+    agent_id: str,
+    content: str,
+    role: str,
+    message_id: str | None = None,
+    metadata: dict[str, Any] | None = None,
+):
+    """Helper to send agent message update."""
+    data: dict[str, Any] = {"content": content, "role": role}
+    if message_id:
+        data["message_id"] = message_id
+    if metadata:
+        data["metadata"] = metadata
+
+    manager.send_to_agent_subscribers(agent_id, _encode("AGENT_MESSAGE", agent_id, data))
+
+
+async def send_agent_thinking(
+    agent_id: str,
+    thinking: str,
+    step: str | None = None,
+    metadata: dict[str, Any] | None = None,
+):
+    """Helper to send agent thinking update."""
+    data: dict[str, Any] = {"thinking": thinking}
+    if step:
+        data["step"] = step
+    if metadata:
+        data["metadata"] = metadata
+
+    manager.send_to_agent_subscribers(agent_id, _encode("AGENT_THINKING", agent_id, data))
+
+
+async def send_agent_error(
+    agent_id: str,
+    error: str,
+    error_code: str | None = None,
+    metadata: dict[str, Any] | None = None,
+):
+    """Helper to send agent error update."""
+    data: dict[str, Any] = {"error": error}
+    if error_code:
+        data["error_code"] = error_code
+    if metadata:
+        data["metadata"] = metadata
+
+    manager.send_to_agent_subscribers(agent_id, _encode("AGENT_ERROR", agent_id, data))
+
+
+async def send_agent_complete(
+    agent_id: str,
+    result: Any,
+    duration: float | None = None,
+    metadata: dict[str, Any] | None = None,
+):
+    """Helper to send agent completion update."""
+    data: dict[str, Any] = {"result": result}
+    if duration:
+        data["duration"] = duration
+    if metadata:
+        data["metadata"] = metadata
+
+    manager.send_to_agent_subscribers(agent_id, _encode("AGENT_COMPLETE", agent_id, data))
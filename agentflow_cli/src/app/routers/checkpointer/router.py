@@ -48,7 +48,9 @@ async def get_state(
     request: Request,
     thread_id: int | str,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "read")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/threads/{thread_id}/state", "checkpointer", "read")
+    ),
 ):
     """Get state from checkpointer.
 
@@ -86,7 +88,9 @@ async def put_state(
     thread_id: str | int,
     payload: StateSchema,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "write")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/threads/{thread_id}/state", "checkpointer", "write")
+    ),
 ):
     """Put state to checkpointer.
 
@@ -127,7 +131,9 @@ async def clear_state(
     request: Request,
     thread_id: int | str,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "delete")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/threads/{thread_id}/state", "checkpointer", "delete")
+    ),
 ):
     """Clear state from checkpointer.
 
@@ -169,7 +175,9 @@ async def put_messages(
     thread_id: str | int,
     payload: PutMessagesSchema,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "write")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/threads/{thread_id}/messages", "checkpointer", "write")
+    ),
 ):
     """Put messages to checkpointer.
 
@@ -217,7 +225,11 @@ async def get_message(
     thread_id: str | int,
     message_id: str | int,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "read")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route(
+            "/v1/threads/{thread_id}/messages/{message_id}", "checkpointer", "read"
+        )
+    ),
 ):
     """Get message from checkpointer.
 
@@ -263,7 +275,9 @@ async def list_messages(
     offset: int | None = None,
     limit: int | None = None,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "read")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/threads/{thread_id}/messages", "checkpointer", "read")
+    ),
 ):
     """List messages from checkpointer.
 
@@ -311,7 +325,11 @@ async def delete_message(
     thread_id: str | int,
     payload: ConfigSchema,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "delete")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route(
+            "/v1/threads/{thread_id}/messages/{message_id}", "checkpointer", "delete"
+        )
+    ),
 ):
     """Delete message from checkpointer.
 
@@ -358,7 +376,9 @@ async def get_thread(
     request: Request,
     thread_id: str | int,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "read")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/threads/{thread_id}", "checkpointer", "read")
+    ),
 ):
     """Get thread from checkpointer.
 
@@ -396,7 +416,9 @@ async def list_threads(
     offset: int | None = None,
     limit: int | None = None,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "read")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/threads", "checkpointer", "read")
+    ),
 ):
     """List threads from checkpointer.
 
@@ -434,7 +456,9 @@ async def delete_thread(
     thread_id: str | int,
     payload: ConfigSchema,
     service: CheckpointerService = InjectAPI(CheckpointerService),
-    user: dict[str, Any] = Depends(RequirePermission("checkpointer", "delete")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/threads/{thread_id}", "checkpointer", "delete")
+    ),
 ):
     """Delete thread from checkpointer.
 
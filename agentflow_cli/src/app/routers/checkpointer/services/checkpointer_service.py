@@ -141,7 +141,7 @@ class CheckpointerService:
     # Threads
     async def get_thread(self, config: dict[str, Any], user: dict) -> ThreadResponseSchema:
         cfg = self._config(config, user)
-        logger.debug(f"User info: {sanitize_for_logging(user)} and thread config: {cfg}")
+        logger.debug("User info: %s and thread config: %s", sanitize_for_logging(user), cfg)
         res = await self.checkpointer.aget_thread(cfg)
         return ThreadResponseSchema(thread=res.model_dump() if res else None)
 
@@ -163,7 +163,7 @@ class CheckpointerService:
         thread_id: Any,
     ) -> ResponseSchema:
         cfg = self._config(config, user)
-        logger.debug(f"User info: {sanitize_for_logging(user)} and thread ID: {thread_id}")
+        logger.debug("User info: %s and thread ID: %s", sanitize_for_logging(user), thread_id)
         res = await self.checkpointer.aclean_thread(cfg)
         return ResponseSchema(success=True, message="Thread deleted successfully", data=res)
 
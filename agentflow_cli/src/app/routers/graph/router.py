@@ -1,8 +1,9 @@
 import asyncio
 import contextlib
-import json
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any
 
+import orjson
 from agentflow.core.realtime.base import ErrorEvent
 from agentflow.core.realtime.queue import LiveInputQueue
 from agentflow.core.state import StreamChunk, StreamEvent
@@ -10,7 +11,7 @@ from fastapi import APIRouter, Depends, Request, WebSocket, WebSocketDisconnect
 from fastapi.logger import logger
 from fastapi.responses import StreamingResponse
 from injectq.integrations import InjectAPI
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from agentflow_cli.src.app.core.auth.permissions import (
     RequirePermission,
@@ -54,6 +55,95 @@ router = APIRouter(
 )
 
 
+# Coalescing bounds for /v1/graph/stream: flush the outgoing buffer at 8 KiB
+# or after 10 ms, whichever comes first. Many tiny LLM tokens collapse into a
+# few ASGI sends without adding perceptible latency.
+STREAM_COALESCE_MAX_BYTES = 8192
+STREAM_COALESCE_MAX_DELAY = 0.01
+
+# Depth of the pump queue feeding the coalescer. Bounded so a slow client
+# backpressures the graph instead of the remaining output piling up in
+# memory; a few dozen chunks is ample headroom for 8 KiB/10 ms batching.
+STREAM_COALESCE_QUEUE_MAXSIZE = 64
+
+
+async def _ndjson(source: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+    """Encode a stream of chunks as newline-delimited JSON bytes.
+
+    The service already yields newline-terminated JSON strings; encoding them
+    here hands Starlette ready-made bytes instead of per-chunk str handling.
+    Dicts/lists and Pydantic models are supported for robustness (orjson for
+    the former, ``model_dump_json`` for the latter).
+    """
+    async for item in source:
+        if isinstance(item, str):
+            yield item.encode("utf-8")
+        elif isinstance(item, bytes):
+            yield item
+        elif isinstance(item, BaseModel):
+            yield item.model_dump_json(serialize_as_any=True).encode("utf-8") + b"\n"
+        else:
+            yield orjson.dumps(item) + b"\n"
+
+
+async def _pump(source: AsyncIterable[bytes], queue: asyncio.Queue, end: object) -> None:
+    """Feed ``source`` into ``queue``, always terminating with the sentinel."""
+    try:
+        async for item in source:
+            await queue.put(item)
+    finally:
+        await queue.put(end)
+
+
+async def _coalesce(
+    source: AsyncIterable[bytes],
+    max_bytes: int = STREAM_COALESCE_MAX_BYTES,
+    max_delay: float = STREAM_COALESCE_MAX_DELAY,
+) -> AsyncIterator[bytes]:
+    """Merge small stream chunks to amortize per-chunk ASGI send overhead.
+
+    Buffers chunks until ``max_bytes`` accumulate or ``max_delay`` seconds pass
+    since the first buffered chunk, then yields the batch as one payload. The
+    source runs in a pump task feeding a queue, so the flush-deadline timeout
+    cancels only a ``queue.get`` -- never the source generator itself.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_COALESCE_QUEUE_MAXSIZE)
+    end = object()
+    pump = asyncio.create_task(_pump(source, queue, end))
+    loop = asyncio.get_running_loop()
+    try:
+        finished = False
+        while not finished:
+            item = await queue.get()
+            if item is end:
+                break
+            buf = bytearray(item)
+            deadline = loop.time() + max_delay
+            while len(buf) < max_bytes:
+                try:
+                    nxt = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        nxt = await asyncio.wait_for(queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                if nxt is end:
+                    finished = True
+                    break
+                buf += nxt
+            yield bytes(buf)
+        # Surface an upstream failure (the pump swallows it into task state)
+        if pump.done() and not pump.cancelled() and pump.exception() is not None:
+            raise pump.exception()  # type: ignore[misc]
+    finally:
+        pump.cancel()
+        with contextlib.suppress(BaseException):
+            await pump
+
+
 @router.post(
     "/v1/graph/invoke",
     summary="Invoke graph execution",
@@ -65,12 +155,14 @@ async def invoke_graph(
     request: Request,
     graph_input: GraphInputSchema,
     service: GraphService = InjectAPI(GraphService),
-    user: dict[str, Any] = Depends(RequirePermission("graph", "invoke")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/graph/invoke", "graph", "invoke")
+    ),
 ):
     """
     Invoke the graph with the provided input and return the final result.
     """
-    logger.info(f"Graph invoke request received with {len(graph_input.messages)} messages")
+    logger.info("Graph invoke request received with %d messages", len(graph_input.messages))
 
     result: GraphInvokeOutputSchema = await service.invoke_graph(
         graph_input,
@@ -95,12 +187,14 @@ async def invoke_graph(
 async def stream_graph(
     graph_input: GraphInputSchema,
     service: GraphService = InjectAPI(GraphService),
-    user: dict[str, Any] = Depends(RequirePermission("graph", "stream")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/graph/stream", "graph", "stream")
+    ),
 ):
     """
     Stream the graph execution with real-time output.
     """
-    logger.info(f"Graph stream request received with {len(graph_input.messages)} messages")
+    logger.info("Graph stream request received with %d messages", len(graph_input.messages))
 
     result = service.stream_graph(
         graph_input,
@@ -108,8 +202,8 @@ async def stream_graph(
     )
 
     return StreamingResponse(
-        result,
-        media_type="text/event-stream",
+        _coalesce(_ndjson(result)),
+        media_type="application/x-ndjson",
         headers={
             "Cache-Control": "no-cache, no-transform",
             "Connection": "keep-alive",
@@ -129,7 +223,7 @@ async def stream_graph(
 async def graph_details(
     request: Request,
     service: GraphService = InjectAPI(GraphService),
-    user: dict[str, Any] = Depends(RequirePermission("graph", "read")),
+    user: dict[str, Any] = Depends(RequirePermission.for_route("/v1/graph", "graph", "read")),
 ):
     """
     Invoke the graph with the provided input and return the final result.
@@ -156,7 +250,9 @@ async def graph_details(
 async def state_schema(
     request: Request,
     service: GraphService = InjectAPI(GraphService),
-    user: dict[str, Any] = Depends(RequirePermission("graph", "read")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/graph:StateSchema", "graph", "read")
+    ),
 ):
     """
     Invoke the graph with the provided input and return the final result.
@@ -184,7 +280,7 @@ async def stop_graph(
     request: Request,
     stop_request: GraphStopSchema,
     service: GraphService = InjectAPI(GraphService),
-    user: dict[str, Any] = Depends(RequirePermission("graph", "stop")),
+    user: dict[str, Any] = Depends(RequirePermission.for_route("/v1/graph/stop", "graph", "stop")),
 ):
     """
     Stop the graph execution for a specific thread.
@@ -195,11 +291,11 @@ async def stop_graph(
     Returns:
         Status information about the stop operation
     """
-    logger.info(f"Graph stop request received for thread: {stop_request.thread_id}")
+    logger.info("Graph stop request received for thread: %s", stop_request.thread_id)
 
     result = await service.stop_graph(stop_request.thread_id, user, stop_request.config)
 
-    logger.info(f"Graph stop completed for thread {stop_request.thread_id}")
+    logger.info("Graph stop completed for thread %s", stop_request.thread_id)
 
     return success_response(
         result,
@@ -218,7 +314,9 @@ async def setup_graph(
     request: Request,
     setup_request: GraphSetupSchema,
     service: GraphService = InjectAPI(GraphService),
-    user: dict[str, Any] = Depends(RequirePermission("graph", "setup")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/graph/setup", "graph", "setup")
+    ),
 ):
     """
     Setup the graph execution for a specific thread.
@@ -256,7 +354,7 @@ async def fix_graph(
     request: Request,
     fix_request: FixGraphRequestSchema,
     service: GraphService = InjectAPI(GraphService),
-    user: dict[str, Any] = Depends(RequirePermission("graph", "fix")),
+    user: dict[str, Any] = Depends(RequirePermission.for_route("/v1/graph/fix", "graph", "fix")),
 ):
     """
     Fix the graph execution state for a specific thread.
@@ -282,7 +380,7 @@ async def fix_graph(
         HTTPException: If the fix operation fails or if no state is found
             for the given thread_id
     """
-    logger.info(f"Graph fix request received for thread: {fix_request.thread_id}")
+    logger.info("Graph fix request received for thread: %s", fix_request.thread_id)
 
     result = await service.fix_graph(
         fix_request.thread_id,
@@ -290,7 +388,7 @@ async def fix_graph(
         fix_request.config,
     )
 
-    logger.info(f"Graph fix completed for thread {fix_request.thread_id}")
+    logger.info("Graph fix completed for thread %s", fix_request.thread_id)
 
     return success_response(
         result,
@@ -308,7 +406,7 @@ async def websocket_graph(
     websocket: WebSocket,
     _guard: None = Depends(realtime_connection_guard),
     service: GraphService = InjectAPI(GraphService),
-    user: dict[str, Any] = Depends(RequirePermission("graph", "stream")),
+    user: dict[str, Any] = Depends(RequirePermission.for_route("/v1/graph/ws", "graph", "stream")),
 ):
     """
     WebSocket endpoint for streaming graph execution.
@@ -352,13 +450,15 @@ async def websocket_graph(
     try:
         while True:
             try:
-                data = await websocket.receive_json()
+                data = await websocket.receive_text()
             except WebSocketDisconnect:
                 logger.info("WebSocket client disconnected")
                 break
 
             try:
-                ws_input = WsGraphInputSchema(**data)
+                # Validate straight from the JSON text frame: one pydantic-core
+                # pass instead of json.loads + per-field __init__ validation.
+                ws_input = WsGraphInputSchema.model_validate_json(data)
             except Exception as e:
                 logger.warning("WebSocket received invalid input: %s", e)
                 await websocket.send_text(
@@ -402,7 +502,7 @@ def _realtime_event_json(event: Any) -> str:
     except Exception as e:
         logger.warning("Realtime event serialization failed (%s): %s", type(event).__name__, e)
         payload = {"type": getattr(event, "type", "unknown")}
-    return json.dumps(payload)
+    return orjson.dumps(payload).decode("utf-8")
 
 
 @router.websocket("/v1/graph/live")
@@ -410,7 +510,9 @@ async def realtime_graph_ws(  # noqa: PLR0915
     websocket: WebSocket,
     _guard: None = Depends(realtime_connection_guard),
     service: GraphService = InjectAPI(GraphService),
-    user: dict[str, Any] = Depends(RequirePermission("graph", "stream")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/graph/live", "graph", "stream")
+    ),
 ):
     """Realtime (audio-to-audio) WebSocket bridge over ``CompiledGraph.arealtime``.
 
@@ -472,8 +574,8 @@ async def realtime_graph_ws(  # noqa: PLR0915
                 if text is None:
                     continue
                 try:
-                    control = json.loads(text)
-                except json.JSONDecodeError:
+                    control = orjson.loads(text)
+                except orjson.JSONDecodeError:
                     logger.warning("Realtime upstream: non-JSON text frame ignored")
                     continue
                 ctype = control.get("type")
@@ -267,7 +267,10 @@ class WsGraphInputSchema(BaseModel):
         then processes to continue execution.
         """
         msgs = self.messages if self.invoke_type == "fresh" else (self.tool_result or [])
-        return GraphInputSchema(
+        # Every field here was already validated when this schema was built
+        # (validate_by_invoke_type guarantees msgs is non-empty), so skip
+        # re-running the Message validators via model_construct.
+        return GraphInputSchema.model_construct(
             messages=msgs,
             initial_state=self.initial_state,
             config=self.config,
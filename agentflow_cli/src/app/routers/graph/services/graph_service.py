@@ -92,7 +92,7 @@ class GraphService:
             ThreadInfo(thread_id=thread_id, thread_name=thread_name),
         )
         if res:
-            logger.info(f"Generated thread name: {thread_name} for thread_id: {thread_id}")
+            logger.info("Generated thread name: %s for thread_id: %s", thread_name, thread_id)
 
         return thread_name
 
@@ -154,8 +154,8 @@ class GraphService:
             HTTPException: If stop operation fails or user doesn't have permission.
         """
         try:
-            logger.info(f"Stopping graph execution for thread: {thread_id}")
-            logger.debug(f"User info: {sanitize_for_logging(user)}")
+            logger.info("Stopping graph execution for thread: %s", thread_id)
+            logger.debug("User info: %s", sanitize_for_logging(user))
 
             # Prepare config with thread_id and user info
             stop_config = {
@@ -170,14 +170,14 @@ class GraphService:
             # Call the graph's astop method
             result = await self._graph.astop(stop_config)
 
-            logger.info(f"Graph stop completed for thread {thread_id}: {result}")
+            logger.info("Graph stop completed for thread %s: %s", thread_id, result)
             return result
 
         except ValueError as e:
-            logger.warning(f"Graph stop input validation failed for thread {thread_id}: {e}")
+            logger.warning("Graph stop input validation failed for thread %s: %s", thread_id, e)
             raise HTTPException(status_code=422, detail=str(e))
         except Exception as e:
-            logger.error(f"Graph stop failed for thread {thread_id}: {e}")
+            logger.error("Graph stop failed for thread %s: %s", thread_id, e)
             raise HTTPException(
                 status_code=500, detail=f"Graph stop failed for thread {thread_id}: {e!s}"
             )
@@ -239,7 +239,7 @@ class GraphService:
             HTTPException: If graph execution fails.
         """
         try:
-            logger.debug(f"Invoking graph with input: {graph_input.messages}")
+            logger.debug("Invoking graph with input: %s", graph_input.messages)
 
             # Prepare the input
             input_data, config, meta = await self._prepare_input(graph_input)
@@ -289,10 +289,10 @@ class GraphService:
             logger.warning("Unsupported media input: %s", e.message)
             raise HTTPException(status_code=422, detail=e.message)
         except ValueError as e:
-            logger.warning(f"Graph input validation failed: {e}")
+            logger.warning("Graph input validation failed: %s", e)
             raise HTTPException(status_code=422, detail=str(e))
         except Exception as e:
-            logger.error(f"Graph execution failed: {e}")
+            logger.error("Graph execution failed: %s", e)
             raise HTTPException(status_code=500, detail=f"Graph execution failed: {e!s}")
 
     async def stream_graph(
@@ -314,7 +314,7 @@ class GraphService:
         # _prepare_input raises before assigning it.
         meta: dict[str, Any] = {}
         try:
-            logger.debug(f"Streaming graph with input: {graph_input.messages}")
+            logger.debug("Streaming graph with input: %s", graph_input.messages)
 
             # Prepare the config
             input_data, config, meta = await self._prepare_input(graph_input)
@@ -375,7 +375,7 @@ class GraphService:
             # would cause: RuntimeError("Caught handled exception, but response
             # already started.")  Instead, we yield a structured error chunk so
             # the client can detect and display the failure.
-            logger.error(f"Graph streaming failed: {e}")
+            logger.error("Graph streaming failed: %s", e)
             yield (
                 StreamChunk(
                     event=StreamEvent.ERROR,
@@ -447,10 +447,10 @@ class GraphService:
             res = self._graph.generate_graph()
             return GraphSchema(**res)
         except ValueError as e:
-            logger.warning(f"Graph details validation failed: {e}")
+            logger.warning("Graph details validation failed: %s", e)
             raise HTTPException(status_code=422, detail=str(e))
         except Exception as e:
-            logger.error(f"Failed to get graph details: {e}")
+            logger.error("Failed to get graph details: %s", e)
             raise HTTPException(status_code=500, detail=f"Failed to get graph details: {e!s}")
 
     async def get_state_schema(self) -> dict:
@@ -459,10 +459,10 @@ class GraphService:
             res: BaseModel = self._graph._state
             return res.model_json_schema()
         except ValueError as e:
-            logger.warning(f"State schema validation failed: {e}")
+            logger.warning("State schema validation failed: %s", e)
             raise HTTPException(status_code=422, detail=str(e))
         except Exception as e:
-            logger.error(f"Failed to get state schema: {e}")
+            logger.error("Failed to get state schema: %s", e)
             raise HTTPException(status_code=500, detail=f"Failed to get state schema: {e!s}")
 
     def _has_empty_tool_call(self, msg: Message) -> bool:
@@ -513,8 +513,8 @@ class GraphService:
             HTTPException: If the operation fails
         """
         try:
-            logger.info(f"Starting fix graph operation for thread: {thread_id}")
-            logger.debug(f"User info: {sanitize_for_logging(user)}")
+            logger.info("Starting fix graph operation for thread: %s", thread_id)
+            logger.debug("User info: %s", sanitize_for_logging(user))
 
             fix_config = {"thread_id": thread_id, "user": user}
             fix_config["user_id"] = user.get("user_id", "anonymous")
@@ -524,7 +524,7 @@ class GraphService:
             logger.debug("Fetching current state from checkpointer")
             state: AgentState | None = await self.checkpointer.aget_state(fix_config)
             if not state:
-                logger.warning(f"No state found for thread: {thread_id}")
+                logger.warning("No state found for thread: %s", thread_id)
                 return {
                     "success": False,
                     "message": f"No state found for thread: {thread_id}",
@@ -533,7 +533,7 @@ class GraphService:
                 }
 
             messages: list[Message] = list(state.context or [])
-            logger.debug(f"Found {len(messages)} messages in state")
+            logger.debug("Found %d messages in state", len(messages))
             if not messages:
                 return {
                     "success": True,
@@ -559,10 +559,10 @@ class GraphService:
                 "state": state.model_dump_json(serialize_as_any=True),
             }
         except ValueError as e:
-            logger.warning(f"Fix graph input validation failed: {e}")
+            logger.warning("Fix graph input validation failed: %s", e)
             raise HTTPException(status_code=422, detail=str(e))
         except Exception as e:
-            logger.error(f"Fix graph operation failed: {e}")
+            logger.error("Fix graph operation failed: %s", e)
             raise HTTPException(status_code=500, detail=f"Fix graph operation failed: {e!s}")
 
     async def setup(self, data: GraphSetupSchema) -> dict:
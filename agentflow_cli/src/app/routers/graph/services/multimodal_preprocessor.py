@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 from typing import TYPE_CHECKING
@@ -15,6 +16,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("agentflow-cli.media")
 
+# Cached-extraction lookups may hit a checkpointer/store backend; bound the
+# fan-out so a message with many attachments cannot flood it.
+_EXTRACTION_LOOKUP_CONCURRENCY = 8
+
 
 async def _get_cached_extraction(media_service: MediaService, file_id: str) -> str | None:
     """Read cached extraction from async or sync service APIs."""
@@ -34,6 +39,25 @@ async def _get_cached_extraction(media_service: MediaService, file_id: str) -> s
     return None
 
 
+async def _gather_cached_extractions(
+    media_service: MediaService,
+    file_ids: list[str],
+) -> dict[str, str | None]:
+    """Look up cached extractions for all file_ids concurrently (bounded)."""
+    unique_ids = list(dict.fromkeys(file_ids))
+    if not unique_ids:
+        return {}
+
+    semaphore = asyncio.Semaphore(min(len(unique_ids), _EXTRACTION_LOOKUP_CONCURRENCY))
+
+    async def _one(file_id: str) -> str | None:
+        async with semaphore:
+            return await _get_cached_extraction(media_service, file_id)
+
+    results = await asyncio.gather(*(_one(fid) for fid in unique_ids))
+    return dict(zip(unique_ids, results, strict=True))
+
+
 async def preprocess_multimodal_messages(
     messages: list[Message],
     media_service: MediaService | None,
@@ -53,6 +77,18 @@ async def preprocess_multimodal_messages(
     if media_service is None:
         return messages
 
+    # Resolve every referenced document's cached extraction up front so the
+    # lookups overlap instead of serializing one await per block.
+    doc_file_ids = [
+        block.media.file_id
+        for msg in messages
+        for block in msg.content
+        if isinstance(block, DocumentBlock)
+        and block.media.kind == "file_id"
+        and block.media.file_id
+    ]
+    cached_extractions = await _gather_cached_extractions(media_service, doc_file_ids)
+
     processed: list[Message] = []
     for msg in messages:
         new_content = []
@@ -64,7 +100,7 @@ async def preprocess_multimodal_messages(
                 and block.media.kind == "file_id"
                 and block.media.file_id
             ):
-                cached = await _get_cached_extraction(media_service, block.media.file_id)
+                cached = cached_extractions.get(block.media.file_id)
                 if cached:
                     new_content.append(TextBlock(text=cached))
                     changed = True
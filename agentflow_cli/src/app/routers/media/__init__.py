@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import inspect
 import json
 import logging
@@ -24,6 +25,10 @@ logger = logging.getLogger("agentflow-cli.media")
 _SIGNED_URL_NAMESPACE = "media:signed-url"
 _EXTRACTION_NAMESPACE = "media:extraction"
 
+# Re-uploads of the same attachment (common across chat turns) skip re-running
+# the extractor: extracted text is memoized by content digest, FIFO-evicted.
+_CONTENT_CACHE_MAX_ENTRIES = 256
+
 
 def _build_config_instance(config_cls: type[Any], values: dict[str, Any]) -> Any:
     """Instantiate third-party config classes using only supported kwargs."""
@@ -142,6 +147,7 @@ class MediaService:
         self._pipeline: DocumentPipeline | None = None
         self._extraction_cache: dict[str, str] = {}  # file_id -> extracted text
         self._signed_url_cache: dict[str, dict[str, Any]] = {}  # file_id -> signed URL payload
+        self._content_extraction_cache: dict[str, str] = {}  # sha256(content) -> extracted text
 
     @property
     def store(self) -> BaseMediaStore:
@@ -210,13 +216,24 @@ class MediaService:
         if self.pipeline.handling == DocumentHandling.EXTRACT_TEXT and self._is_extractable(
             mime_type
         ):
-            try:
-                text = await self.pipeline.extractor.extract(data, filename)
+            # Content digest (not a security boundary) dedupes repeat uploads.
+            digest = hashlib.sha256(data, usedforsecurity=False).hexdigest()
+            text: str | None = self._content_extraction_cache.get(digest)
+            if text is None:
+                try:
+                    text = await self.pipeline.extractor.extract(data, filename)
+                except Exception as exc:
+                    logger.warning("Extraction failed for %s: %s", filename, exc)
+                    text = None
                 if text:
-                    result["extracted_text"] = text
-                    await self._cache_extraction(storage_key, text)
-            except Exception as exc:
-                logger.warning("Extraction failed for %s: %s", filename, exc)
+                    if len(self._content_extraction_cache) >= _CONTENT_CACHE_MAX_ENTRIES:
+                        self._content_extraction_cache.pop(
+                            next(iter(self._content_extraction_cache)), None
+                        )
+                    self._content_extraction_cache[digest] = text
+            if text:
+                result["extracted_text"] = text
+                await self._cache_extraction(storage_key, text)
 
         direct_url_info = await self.get_direct_url_info(
             storage_key,
@@ -380,16 +397,22 @@ class MediaService:
 
     @staticmethod
     def _is_extractable(mime_type: str) -> bool:
-        extractable = {
-            "application/pdf",
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "application/msword",
-            "text/html",
-            "text/xml",
-            "application/xml",
-            "text/markdown",
-            "text/csv",
-            "application/json",
-            "text/plain",
-        }
-        return mime_type.lower() in extractable
+        return mime_type.lower() in _EXTRACTABLE_MIME_TYPES
+
+
+# MIME types the document pipeline can extract text from; built once so the
+# per-upload check is a single frozenset probe instead of a set construction.
+_EXTRACTABLE_MIME_TYPES = frozenset(
+    {
+        "application/pdf",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/msword",
+        "text/html",
+        "text/xml",
+        "application/xml",
+        "text/markdown",
+        "text/csv",
+        "application/json",
+        "text/plain",
+    }
+)
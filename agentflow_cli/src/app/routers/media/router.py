@@ -25,6 +25,57 @@ from agentflow_cli.src.app.utils import success_response
 router = APIRouter(tags=["Files"])
 
 
+# Common upload types resolved with one dict probe; mimetypes.guess_type (with
+# its lazy registry init and per-call suffix parsing) stays as the fallback for
+# anything rarer. Only consulted when the client omits Content-Type.
+_MIME_MAP: dict[str, str] = {
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".csv": "text/csv",
+    ".json": "application/json",
+    ".html": "text/html",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".ogg": "audio/ogg",
+    ".mp4": "video/mp4",
+}
+
+
+# Read uploads from the Starlette spool in 1 MiB slices instead of one
+# file.read() of the whole body; oversized uploads are rejected as soon as the
+# cap is crossed rather than after the full body has been materialized.
+_UPLOAD_CHUNK_BYTES = 1 << 20
+
+
+async def _read_upload(file: UploadFile, max_size_bytes: int) -> bytes:
+    buf = bytearray()
+    while chunk := await file.read(_UPLOAD_CHUNK_BYTES):
+        buf += chunk
+        if len(buf) > max_size_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File size exceeds maximum {max_size_bytes // (1024 * 1024)}MB",
+            )
+    return bytes(buf)
+
+
+def _guess_mime(filename: str) -> str:
+    """Resolve a MIME type from the filename, cheaply for common suffixes."""
+    suffix = filename[filename.rfind(".") :].lower() if "." in filename else ""
+    mime = _MIME_MAP.get(suffix)
+    if mime is None:
+        mime = mimetypes.guess_type(filename)[0]
+    return mime or "application/octet-stream"
+
+
 # ------------------------------------------------------------------
 # 4.1  POST /v1/files/upload
 # ------------------------------------------------------------------
@@ -46,11 +97,11 @@ async def upload_file(
     if file.filename is None:
         raise HTTPException(status_code=400, detail="filename is required")
 
-    data = await file.read()
+    data = await _read_upload(file, service.max_size_bytes)
     if not data:
         raise HTTPException(status_code=400, detail="Empty file")
 
-    mime = file.content_type or mimetypes.guess_type(file.filename)[0] or "application/octet-stream"
+    mime = file.content_type or _guess_mime(file.filename)
 
     logger.info("File upload: %s (%s, %d bytes)", file.filename, mime, len(data))
 
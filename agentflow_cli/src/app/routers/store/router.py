@@ -42,7 +42,9 @@ async def create_memory(
     request: Request,
     payload: StoreMemorySchema,
     service: StoreService = InjectAPI(StoreService),
-    user: dict[str, Any] = Depends(RequirePermission("store", "write")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/store/memories", "store", "write")
+    ),
 ):
     """Store a memory item using the configured store."""
 
@@ -61,7 +63,9 @@ async def search_memories(
     request: Request,
     payload: SearchMemorySchema,
     service: StoreService = InjectAPI(StoreService),
-    user: dict[str, Any] = Depends(RequirePermission("store", "read")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/store/search", "store", "read")
+    ),
 ):
     """Search stored memories."""
     if not payload.query or (isinstance(payload.query, str) and not payload.query.strip()):
@@ -86,7 +90,9 @@ async def get_memory(
         description="Optional configuration and options for retrieving the memory.",
     ),
     service: StoreService = InjectAPI(StoreService),
-    user: dict[str, Any] = Depends(RequirePermission("store", "read")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/store/memories/{memory_id}", "store", "read")
+    ),
 ):
     """Get a memory by ID."""
     if not memory_id or not memory_id.strip():
@@ -112,7 +118,9 @@ async def list_memories(
         description="Optional configuration, limit, and options for listing memories.",
     ),
     service: StoreService = InjectAPI(StoreService),
-    user: dict[str, Any] = Depends(RequirePermission("store", "read")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/store/memories/list", "store", "read")
+    ),
 ):
     """List stored memories."""
 
@@ -139,7 +147,9 @@ async def update_memory(
     memory_id: str,
     payload: UpdateMemorySchema,
     service: StoreService = InjectAPI(StoreService),
-    user: dict[str, Any] = Depends(RequirePermission("store", "write")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/store/memories/{memory_id}", "store", "write")
+    ),
 ):
     """Update a stored memory."""
     if not memory_id or not memory_id.strip():
@@ -164,7 +174,9 @@ async def delete_memory(
         description="Optional configuration overrides forwarded to the store backend.",
     ),
     service: StoreService = InjectAPI(StoreService),
-    user: dict[str, Any] = Depends(RequirePermission("store", "delete")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/store/memories/{memory_id}", "store", "delete")
+    ),
 ):
     """Delete a stored memory."""
     if not memory_id or not memory_id.strip():
@@ -187,7 +199,9 @@ async def forget_memory(
     request: Request,
     payload: ForgetMemorySchema,
     service: StoreService = InjectAPI(StoreService),
-    user: dict[str, Any] = Depends(RequirePermission("store", "delete")),
+    user: dict[str, Any] = Depends(
+        RequirePermission.for_route("/v1/store/memories/forget", "store", "delete")
+    ),
 ):
     """Forget memories based on filters."""
 
@@ -20,6 +20,23 @@ except ImportError:  # pragma: no cover
     AsyncTextExtractor = None  # type: ignore[assignment]
 
 
+# One AsyncTextExtractor serves every DocumentExtractor in the process; its
+# construction probes backend availability, which there is no reason to repeat.
+_shared_extractor: Any | None = None
+
+
+def _get_shared_extractor() -> Any:
+    global _shared_extractor  # noqa: PLW0603
+    if AsyncTextExtractor is None:
+        raise ImportError(
+            "textxtract is required for document extraction. "
+            'Install with `pip install "10xscale-agentflow-cli[media]"`'
+        )
+    if _shared_extractor is None:
+        _shared_extractor = AsyncTextExtractor()
+    return _shared_extractor
+
+
 class DocumentExtractor:
     """Wraps textxtract AsyncTextExtractor for API-side document extraction.
 
@@ -34,13 +51,7 @@ class DocumentExtractor:
             self.extractor = extractor
             return
 
-        if AsyncTextExtractor is None:
-            raise ImportError(
-                "textxtract is required for document extraction. "
-                'Install with `pip install "10xscale-agentflow-cli[media]"`'
-            )
-
-        self.extractor = AsyncTextExtractor()
+        self.extractor = _get_shared_extractor()
 
     async def extract(self, data: bytes | str, filename: str | None = None) -> str | None:
         """Extract text from bytes or a local path.
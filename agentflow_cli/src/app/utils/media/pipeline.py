@@ -6,6 +6,7 @@ Orchestrates: receive uploaded file -> extract text via DocumentExtractor
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from base64 import b64decode
 from typing import Any
@@ -18,6 +19,10 @@ from .extractor import DocumentExtractor
 
 logger = logging.getLogger("agentflow_cli.media.pipeline")
 
+# Base64 payloads at or above this length are decoded off the event loop;
+# below it the thread hand-off costs more than the decode itself.
+_B64_OFFLOAD_MIN_CHARS = 1 << 20
+
 
 class DocumentPipeline:
     """Document processing pipeline with extraction config.
@@ -70,7 +75,11 @@ class DocumentPipeline:
         media = document_block.media
 
         if media.kind == "data" and media.data_base64:
-            decoded = b64decode(media.data_base64)
+            payload = media.data_base64
+            if len(payload) >= _B64_OFFLOAD_MIN_CHARS:
+                decoded = await asyncio.to_thread(b64decode, payload)
+            else:
+                decoded = b64decode(payload)
             filename = media.filename or "document.pdf"
             extracted = await self.extractor.extract(decoded, filename)
             if extracted:
@@ -17,8 +17,7 @@ Examples:
 
 from typing import Any, TypeVar
 
-from fastapi import Request
-from fastapi.responses import ORJSONResponse
+from fastapi import Request, Response
 
 from .schemas import (
     ErrorOutputSchema,
@@ -84,13 +83,19 @@ def success_response(
             Defaults to None.
 
     Returns:
-        ORJSONResponse: The JSON response containing the data,
+        Response: The JSON response containing the data,
             message, and metadata.
     """
     response: SuccessResponse = SuccessResponse(
         data=res, metadata=merge_metadata(metadata, request, message)
     )
-    return ORJSONResponse(response.model_dump(), status_code=status_code)
+    # Serialize model -> JSON in one pydantic-core pass instead of
+    # model_dump() to Python objects followed by a second JSON encode.
+    return Response(
+        content=response.model_dump_json(serialize_as_any=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
 def error_response(
@@ -117,7 +122,7 @@ def error_response(
             Default is None.
 
     Returns:
-        ORJSONResponse: The JSON response containing the error details, message,
+        Response: The JSON response containing the error details, message,
             and metadata.
     """
     error = ErrorResponse(
@@ -126,4 +131,8 @@ def error_response(
         ),
         metadata=merge_metadata(metadata, request, message),
     )
-    return ORJSONResponse(error.model_dump(), status_code=status_code)
+    return Response(
+        content=error.model_dump_json(serialize_as_any=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
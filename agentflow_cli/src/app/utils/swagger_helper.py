@@ -5,6 +5,7 @@ Contains helper functions to generate Swagger Responses
 
 import uuid
 from datetime import datetime
+from functools import cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -111,6 +112,7 @@ class _SwaggerError426Schemas(BaseModel):
     )
 
 
+@cache
 def generate_swagger_responses(
     model: type[BaseModel],
     show_pagination: bool = False,
@@ -129,6 +131,11 @@ def generate_swagger_responses(
     then the response will have pagination metadata.
     It will be used to generate redoc and swagger documentation.
 
+    Results are cached per (model, show_pagination): routers reuse the same
+    schemas across endpoints, and re-specializing the generic success model
+    per decorator re-walks the Pydantic schema at import time for nothing.
+    Callers must treat the returned dict as read-only.
+
     Args:
         model (type[BaseModel]): Base Pydantic Model class, which will be used as response.
         show_pagination (bool, optional): Show Pagination in Swagger Response. Defaults to False.
@@ -17,9 +17,10 @@ Setup:
 
 import os
 import hashlib
-import hmac
-from datetime import datetime
-from typing import Any
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, NamedTuple
 
 from fastapi import HTTPException, Response, status
 from fastapi.security import HTTPAuthorizationCredentials
@@ -29,12 +30,41 @@ from fastapi.security import HTTPAuthorizationCredentials
 from agentflow_cli.src.app.core.auth.base_auth import BaseAuth
 
 
+# "authenticated_at" is informational, so second resolution is enough;
+# caching the formatted string avoids a datetime + isoformat per request.
+_ts_cache: list[Any] = [0, ""]
+
+
+def _iso_now() -> str:
+    """Return the current UTC time in ISO format, cached per second."""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[0] = t
+        _ts_cache[1] = datetime.fromtimestamp(t, tz=timezone.utc).isoformat()
+    return _ts_cache[1]
+
+
+class KeyMeta(NamedTuple):
+    """Per-key metadata.
+
+    A NamedTuple instead of a dict: with thousands of tenant keys the
+    fixed-layout tuple is several times smaller than per-key dicts, and
+    ``sys.intern`` on user_id/role dedupes strings repeated across keys.
+    """
+
+    user_id: str
+    role: str
+    key_prefix: str
+
+
 class APIKeyAuth(BaseAuth):
     """
     API Key authentication backend.
 
     Validates API keys from Authorization header and returns user context.
-    Supports both plain keys and hashed keys for better security.
+    Keys are held only as SHA-256 digests: lookup is one hash of the
+    presented key plus a fixed-size dict probe, so no plain-text key
+    comparison (and its timing side channel) ever happens at request time.
     """
 
     def __init__(self):
@@ -46,8 +76,8 @@ class APIKeyAuth(BaseAuth):
         if not keys_string:
             print("WARNING: No API keys configured. Set API_KEYS environment variable.")
 
-        # Parse API keys and associated metadata
-        self.valid_keys: dict[str, dict[str, Any]] = {}
+        # Parse API keys; store sha256(key) digests, never the plain keys
+        self.valid_keys: dict[bytes, KeyMeta] = {}
 
         for key_entry in keys_string.split(","):
             if ":" in key_entry:
@@ -56,17 +86,16 @@ class APIKeyAuth(BaseAuth):
                 key = parts[0]
                 user_id = parts[1] if len(parts) > 1 else f"api_key_{key[:8]}"
                 role = parts[2] if len(parts) > 2 else "user"
-
-                self.valid_keys[key] = {"user_id": user_id, "role": role, "key_prefix": key[:8]}
             else:
                 # Format: key (use prefix as user_id)
                 key = key_entry.strip()
-                if key:
-                    self.valid_keys[key] = {
-                        "user_id": f"api_key_{key[:8]}",
-                        "role": "user",
-                        "key_prefix": key[:8],
-                    }
+                if not key:
+                    continue
+                user_id = f"api_key_{key[:8]}"
+                role = "user"
+
+            digest = hashlib.sha256(key.encode()).digest()
+            self.valid_keys[digest] = KeyMeta(sys.intern(user_id), sys.intern(role), key[:8])
 
         print(f"Loaded {len(self.valid_keys)} API keys")
 
@@ -103,8 +132,10 @@ class APIKeyAuth(BaseAuth):
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Check if API key is valid
-        key_metadata = self.valid_keys.get(api_key)
+        # Hash the presented key and probe the digest table. Matching on
+        # fixed-size sha256 digests means the comparison cost is independent
+        # of how much of the key an attacker guessed right.
+        key_metadata = self.valid_keys.get(hashlib.sha256(api_key.encode()).digest())
 
         if not key_metadata:
             # Log failed attempt (without exposing the key)
@@ -117,15 +148,15 @@ class APIKeyAuth(BaseAuth):
             )
 
         # Log successful authentication
-        print(f"API key authenticated: {key_metadata['user_id']}")
+        print(f"API key authenticated: {key_metadata.user_id}")
 
-        # Return user context
+        # Return user context (built only on the success path)
         return {
-            "user_id": key_metadata["user_id"],
+            "user_id": key_metadata.user_id,
             "auth_method": "api_key",
-            "role": key_metadata["role"],
-            "key_prefix": key_metadata["key_prefix"],
-            "authenticated_at": datetime.utcnow().isoformat(),
+            "role": key_metadata.role,
+            "key_prefix": key_metadata.key_prefix,
+            "authenticated_at": _iso_now(),
         }
 
     def extract_user_id(self, user: dict[str, str]) -> str | None:
@@ -155,7 +186,9 @@ class HashedAPIKeyAuth(BaseAuth):
         # Format: hashed_key1:user1,hashed_key2:user2
         keys_string = os.getenv("API_KEY_HASHES", "")
 
-        self.valid_key_hashes: dict[str, dict[str, Any]] = {}
+        # Keyed by raw digest bytes: hex decoding happens once here, so each
+        # request is one sha256 + one dict probe with no hex round-trip.
+        self.valid_key_hashes: dict[bytes, dict[str, Any]] = {}
 
         for key_entry in keys_string.split(","):
             if ":" in key_entry:
@@ -164,7 +197,13 @@ class HashedAPIKeyAuth(BaseAuth):
                 user_id = parts[1] if len(parts) > 1 else f"user_{key_hash[:8]}"
                 role = parts[2] if len(parts) > 2 else "user"
 
-                self.valid_key_hashes[key_hash] = {"user_id": user_id, "role": role}
+                try:
+                    digest = bytes.fromhex(key_hash)
+                except ValueError:
+                    print(f"WARNING: Skipping malformed key hash: {key_hash[:8]}...")
+                    continue
+
+                self.valid_key_hashes[digest] = {"user_id": user_id, "role": role}
 
         print(f"Loaded {len(self.valid_key_hashes)} hashed API keys")
 
@@ -192,10 +231,9 @@ class HashedAPIKeyAuth(BaseAuth):
             )
 
         api_key = credentials.credentials
-        key_hash = self.hash_key(api_key)
 
-        # Check if hash matches
-        key_metadata = self.valid_key_hashes.get(key_hash)
+        # Check if hash matches (single sha256 + fixed-size digest probe)
+        key_metadata = self.valid_key_hashes.get(hashlib.sha256(api_key.encode()).digest())
 
         if not key_metadata:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
@@ -204,7 +242,7 @@ class HashedAPIKeyAuth(BaseAuth):
             "user_id": key_metadata["user_id"],
             "auth_method": "hashed_api_key",
             "role": key_metadata["role"],
-            "authenticated_at": datetime.utcnow().isoformat(),
+            "authenticated_at": _iso_now(),
         }
 
     def extract_user_id(self, user: dict[str, str]) -> str | None:
@@ -16,7 +16,8 @@ Usage:
 """
 
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import jwt
@@ -32,6 +33,25 @@ JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES
 # Security scheme
 security = HTTPBearer()
 
+# Decode cache: token -> (payload, exp). Signature verification is the
+# expensive part of jwt.decode and a token's validity cannot change before
+# its exp, so repeated requests with the same token skip the re-verify.
+_DECODE_CACHE_MAX_ENTRIES = 4096
+_decode_cache: dict[str, tuple[dict[str, Any], float]] = {}
+
+# Response timestamps are informational, so second resolution is enough;
+# caching the formatted string avoids a datetime + isoformat per request.
+_ts_cache: list[Any] = [0, ""]
+
+
+def _iso_now() -> str:
+    """Return the current UTC time in ISO format, cached per second."""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[0] = t
+        _ts_cache[1] = datetime.fromtimestamp(t, tz=timezone.utc).isoformat()
+    return _ts_cache[1]
+
 
 class TokenData(BaseModel):
     """JWT token payload structure."""
@@ -71,9 +91,9 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
     to_encode = data.copy()
 
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire})
 
@@ -96,6 +116,13 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
     """
     token = credentials.credentials
 
+    cached = _decode_cache.get(token)
+    if cached is not None:
+        payload, exp = cached
+        if exp > time.time():
+            return payload
+        del _decode_cache[token]
+
     try:
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
         user_id = payload.get("user_id")
@@ -107,6 +134,13 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        # Cache only after a successful decode, bounded with FIFO eviction.
+        exp = payload.get("exp")
+        if exp:
+            if len(_decode_cache) >= _DECODE_CACHE_MAX_ENTRIES:
+                _decode_cache.pop(next(iter(_decode_cache)))
+            _decode_cache[token] = (payload, float(exp))
+
         return payload
 
     except jwt.ExpiredSignatureError:
@@ -175,7 +209,7 @@ async def protected_endpoint(user: dict = Depends(verify_token)):
     return {
         "message": f"Hello {user.get('email')}!",
         "user_id": user.get("user_id"),
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _iso_now(),
     }
 
 
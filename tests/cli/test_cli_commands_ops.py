@@ -57,7 +57,7 @@ def test_api_command_minimal_success(monkeypatch, tmp_path, silent_output):
 
     called = {}
 
-    def fake_run(app_path, host, port, reload, workers):
+    def fake_run(app_path, host, port, reload, workers, ws_per_message_deflate):
         called.update(
             {
                 "app_path": app_path,
@@ -65,6 +65,7 @@ def test_api_command_minimal_success(monkeypatch, tmp_path, silent_output):
                 "port": port,
                 "reload": reload,
                 "workers": workers,
+                "ws_per_message_deflate": ws_per_message_deflate,
             }
         )
 
@@ -114,6 +114,19 @@ class TestMediaService:
         assert await svc.aget_cached_extraction(result["file_id"]) == "Cached!"
         assert svc.get_cached_extraction("missing") is None
 
+    @pytest.mark.asyncio
+    async def test_repeat_upload_reuses_extraction_by_content(self):
+        svc = self._make_service()
+        with patch.object(
+            svc.pipeline.extractor, "extract", new_callable=AsyncMock, return_value="Once!"
+        ) as extract:
+            first = await svc.upload_file(b"%PDF same bytes", "a.pdf", "application/pdf")
+            second = await svc.upload_file(b"%PDF same bytes", "b.pdf", "application/pdf")
+        # Identical content: extraction ran once, both file_ids got the text
+        extract.assert_awaited_once()
+        assert first["extracted_text"] == second["extracted_text"] == "Once!"
+        assert svc.get_cached_extraction(second["file_id"]) == "Once!"
+
     @pytest.mark.asyncio
     async def test_get_file_info_uses_store_metadata_without_blob_download(self):
         svc = self._make_service()
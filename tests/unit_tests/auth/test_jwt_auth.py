@@ -690,3 +690,65 @@ class TestJwtAuthIntegration:
             assert result["count"] == 42
             assert result["active"] is True
             assert result["nullable"] is None
+
+
+class TestJwtAuthTokenCache:
+    """Repeat requests with the same bearer token skip jwt.decode."""
+
+    @pytest.fixture
+    def jwt_auth(self) -> JwtAuth:
+        return JwtAuth()
+
+    @pytest.fixture
+    def jwt_env_vars(self):
+        with patch.dict(
+            os.environ,
+            {
+                "JWT_SECRET_KEY": TEST_SECRET_KEY,
+                "JWT_ALGORITHM": TEST_ALGORITHM,
+            },
+        ):
+            yield
+
+    def _credentials(self, payload: dict) -> HTTPAuthorizationCredentials:
+        token = jwt.encode(payload, TEST_SECRET_KEY, algorithm=TEST_ALGORITHM)
+        return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    def test_second_call_uses_cache(self, jwt_auth, jwt_env_vars):
+        credentials = self._credentials(
+            {"user_id": "user-123", "exp": datetime.now(UTC) + timedelta(hours=1)}
+        )
+
+        first = jwt_auth.authenticate(None, Response(), credentials)
+        with patch(
+            "agentflow_cli.src.app.core.auth.jwt_auth.jwt.decode",
+        ) as mock_decode:
+            second = jwt_auth.authenticate(None, Response(), credentials)
+
+        mock_decode.assert_not_called()
+        assert second == first
+
+    def test_cached_claims_are_copies(self, jwt_auth, jwt_env_vars):
+        credentials = self._credentials(
+            {"user_id": "user-123", "exp": datetime.now(UTC) + timedelta(hours=1)}
+        )
+
+        first = jwt_auth.authenticate(None, Response(), credentials)
+        first["injected"] = True
+        second = jwt_auth.authenticate(None, Response(), credentials)
+        assert "injected" not in second
+
+    def test_expired_cache_entry_reverifies(self, jwt_auth, jwt_env_vars):
+        exp = datetime.now(UTC) + timedelta(hours=1)
+        credentials = self._credentials({"user_id": "user-123", "exp": exp})
+
+        jwt_auth.authenticate(None, Response(), credentials)
+        # Force the cached entry past its expiry; the stale entry must be
+        # dropped and the token verified again.
+        token = credentials.credentials
+        expires_at, claims = jwt_auth._token_cache[token]
+        jwt_auth._token_cache[token] = (0.0, claims)
+
+        result = jwt_auth.authenticate(None, Response(), credentials)
+        assert result["user_id"] == "user-123"
+        assert jwt_auth._token_cache[token][0] > 0.0
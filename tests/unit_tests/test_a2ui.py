@@ -0,0 +1,143 @@
+"""Unit tests for the A2UI ConnectionManager.
+
+The manager is driven directly with mock WebSockets (the router itself is not
+mounted by setup_router yet), focusing on the per-connection writer queue:
+fan-out is synchronous and a burst of queued messages collapses into a single
+frame.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from agentflow_cli.src.app.routers.a2ui import ConnectionManager, _encode
+
+
+def _make_websocket():
+    ws = MagicMock()
+    ws.accept = AsyncMock()
+    ws.send_bytes = AsyncMock()
+    return ws
+
+
+async def _drain(manager):
+    """Yield to the event loop so writer tasks can run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConnectionManager:
+    @pytest.mark.asyncio
+    async def test_connect_and_disconnect_counts(self):
+        manager = ConnectionManager()
+        ws1, ws2 = _make_websocket(), _make_websocket()
+
+        await manager.connect(ws1, "agent-1")
+        await manager.connect(ws2, "agent-1")
+        assert manager.get_connection_count("agent-1") == 2
+        assert manager.get_connection_count() == 2
+
+        manager.disconnect(ws1, "agent-1")
+        assert manager.get_connection_count("agent-1") == 1
+
+        manager.disconnect(ws2, "agent-1")
+        assert manager.get_connection_count() == 0
+        assert "agent-1" not in manager.active_connections
+
+    @pytest.mark.asyncio
+    async def test_single_message_sent_as_object_frame(self):
+        manager = ConnectionManager()
+        ws = _make_websocket()
+        await manager.connect(ws, "agent-1")
+
+        manager.send_to_agent_subscribers("agent-1", orjson.dumps({"message_type": "AGENT_STATUS"}))
+        await _drain(manager)
+
+        ws.send_bytes.assert_awaited_once()
+        frame = orjson.loads(ws.send_bytes.await_args.args[0])
+        assert frame == {"message_type": "AGENT_STATUS"}
+        manager.disconnect(ws, "agent-1")
+
+    @pytest.mark.asyncio
+    async def test_burst_batched_into_single_array_frame(self):
+        manager = ConnectionManager()
+        ws = _make_websocket()
+        await manager.connect(ws, "agent-1")
+
+        # Queue a burst before the writer task gets to run; it should drain
+        # the whole queue into one frame.
+        for i in range(3):
+            manager.send_to_agent_subscribers("agent-1", orjson.dumps({"seq": i}))
+        await _drain(manager)
+
+        ws.send_bytes.assert_awaited_once()
+        frame = orjson.loads(ws.send_bytes.await_args.args[0])
+        assert frame == [{"seq": 0}, {"seq": 1}, {"seq": 2}]
+        manager.disconnect(ws, "agent-1")
+
+    @pytest.mark.asyncio
+    async def test_failed_send_disconnects_subscriber(self):
+        manager = ConnectionManager()
+        ws = _make_websocket()
+        ws.send_bytes = AsyncMock(side_effect=RuntimeError("gone"))
+        await manager.connect(ws, "agent-1")
+
+        manager.send_to_agent_subscribers("agent-1", orjson.dumps({"message_type": "AGENT_STATUS"}))
+        await _drain(manager)
+
+        assert manager.get_connection_count("agent-1") == 0
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_all_agents(self):
+        manager = ConnectionManager()
+        ws1, ws2 = _make_websocket(), _make_websocket()
+        await manager.connect(ws1, "agent-1")
+        await manager.connect(ws2, "agent-2")
+
+        manager.broadcast(orjson.dumps({"message_type": "SYSTEM"}))
+        await _drain(manager)
+
+        ws1.send_bytes.assert_awaited_once()
+        ws2.send_bytes.assert_awaited_once()
+        manager.disconnect(ws1, "agent-1")
+        manager.disconnect(ws2, "agent-2")
+
+
+class TestEncode:
+    def test_encode_matches_a2ui_message_shape(self):
+        frame = orjson.loads(_encode("AGENT_STATUS", "agent-1", {"status": "running"}))
+        assert frame["message_type"] == "AGENT_STATUS"
+        assert frame["agent_id"] == "agent-1"
+        assert frame["data"] == {"status": "running"}
+        assert "timestamp" in frame
+
+
+class TestBackpressure:
+    @pytest.mark.asyncio
+    async def test_slow_client_drops_oldest_message(self, monkeypatch):
+        import agentflow_cli.src.app.routers.a2ui as a2ui
+
+        monkeypatch.setattr(a2ui, "_QUEUE_MAXSIZE", 1)
+        manager = ConnectionManager()
+        ws = _make_websocket()
+        stall = asyncio.Event()
+
+        async def _blocked_send(payload):
+            await stall.wait()
+
+        ws.send_bytes = AsyncMock(side_effect=_blocked_send)
+        await manager.connect(ws, "agent-1")
+        # First message is taken by the (stalled) writer; the next two contend
+        # for the single queue slot, dropping the older one.
+        for i in range(3):
+            manager.send_to_agent_subscribers("agent-1", orjson.dumps({"seq": i}))
+            await asyncio.sleep(0)
+
+        subscriber = next(iter(manager.active_connections["agent-1"].values()))
+        assert subscriber.dropped == 1
+        assert subscriber.queue.get_nowait() == orjson.dumps({"seq": 2})
+
+        stall.set()
+        manager.disconnect(ws, "agent-1")
@@ -5,6 +5,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import Request
 
 from agentflow_cli.src.app.routers.graph.router import (
+    _coalesce,
+    _ndjson,
     invoke_graph,
     stream_graph,
     graph_details,
@@ -160,3 +162,45 @@ async def test_fix_graph_endpoint(mock_request, mock_service, mock_user):
         )
         assert res == {"status": "success"}
         mock_service.fix_graph.assert_called_once_with("thread-abc", mock_user, {"clean": True})
+
+
+@pytest.mark.asyncio
+async def test_ndjson_encodes_str_dict_and_bytes():
+    async def _src():
+        yield '{"a": 1}\n'
+        yield {"b": 2}
+        yield b'{"c": 3}\n'
+
+    chunks = [chunk async for chunk in _ndjson(_src())]
+    assert chunks == [b'{"a": 1}\n', b'{"b":2}\n', b'{"c": 3}\n']
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_burst_into_single_chunk():
+    async def _src():
+        for i in range(5):
+            yield f"chunk-{i}\n".encode()
+
+    chunks = [chunk async for chunk in _coalesce(_src())]
+    assert chunks == [b"".join(f"chunk-{i}\n".encode() for i in range(5))]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_on_max_bytes():
+    async def _src():
+        yield b"x" * 100
+        yield b"y" * 100
+
+    chunks = [chunk async for chunk in _coalesce(_src(), max_bytes=100)]
+    assert chunks == [b"x" * 100, b"y" * 100]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_propagates_upstream_error():
+    async def _src():
+        yield b"ok"
+        raise RuntimeError("upstream failed")
+
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        async for _ in _coalesce(_src()):
+            pass
@@ -280,15 +280,13 @@ class TestSanitizingFormatter:
 
     def test_sanitizing_formatter_initialization(self):
         """Test SanitizingFormatter initialization."""
-        base_formatter = logging.Formatter("%(message)s")
-        formatter = SanitizingFormatter(base_formatter)
+        formatter = SanitizingFormatter("%(message)s")
 
-        assert formatter.base_formatter is base_formatter
+        assert isinstance(formatter, logging.Formatter)
 
     def test_sanitizing_formatter_format(self):
         """Test SanitizingFormatter.format method."""
-        base_formatter = logging.Formatter("%(message)s")
-        formatter = SanitizingFormatter(base_formatter)
+        formatter = SanitizingFormatter("%(message)s")
 
         record = logging.LogRecord(
             name="test",
@@ -309,8 +307,7 @@ class TestSanitizingFormatter:
 
     def test_sanitizing_formatter_with_no_args(self):
         """Test SanitizingFormatter with record without args."""
-        base_formatter = logging.Formatter("%(message)s")
-        formatter = SanitizingFormatter(base_formatter)
+        formatter = SanitizingFormatter("%(message)s")
 
         record = logging.LogRecord(
             name="test",
@@ -326,9 +323,8 @@ class TestSanitizingFormatter:
         assert result == "Test message"
 
     def test_sanitizing_formatter_preserves_formatting(self):
-        """Test SanitizingFormatter preserves base formatter behavior."""
-        base_formatter = logging.Formatter("[%(levelname)s] %(message)s")
-        formatter = SanitizingFormatter(base_formatter)
+        """Test SanitizingFormatter preserves standard Formatter behavior."""
+        formatter = SanitizingFormatter("[%(levelname)s] %(message)s")
 
         record = logging.LogRecord(
             name="test",
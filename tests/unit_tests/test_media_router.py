@@ -18,7 +18,14 @@ def mock_request():
 @pytest.fixture
 def mock_service():
     """Mock MediaService."""
-    return AsyncMock()
+    service = AsyncMock()
+    service.max_size_bytes = 10 * 1024 * 1024
+    return service
+
+
+def _mock_read(data: bytes) -> AsyncMock:
+    """Mock UploadFile.read the way the chunked reader consumes it."""
+    return AsyncMock(side_effect=[data, b""])
 
 
 @pytest.fixture
@@ -56,7 +63,7 @@ class TestUploadFileLogic:
 
         mock_file = MagicMock(spec=UploadFile)
         mock_file.filename = "test.txt"
-        mock_file.read = AsyncMock(return_value=b"")
+        mock_file.read = _mock_read(b"")
 
         with pytest.raises(HTTPException) as exc_info:
             await upload_file(
@@ -89,7 +96,7 @@ class TestUploadFileLogic:
         mock_file = MagicMock(spec=UploadFile)
         mock_file.filename = "test.txt"
         mock_file.content_type = "text/plain"
-        mock_file.read = AsyncMock(return_value=b"test data")
+        mock_file.read = _mock_read(b"test data")
 
         result = await upload_file(
             request=mock_request,
@@ -110,7 +117,7 @@ class TestUploadFileLogic:
         mock_file = MagicMock(spec=UploadFile)
         mock_file.filename = "test.txt"
         mock_file.content_type = "text/plain"
-        mock_file.read = AsyncMock(return_value=b"test data")
+        mock_file.read = _mock_read(b"test data")
 
         with pytest.raises(HTTPException) as exc_info:
             await upload_file(
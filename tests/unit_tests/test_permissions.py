@@ -242,3 +242,39 @@ class TestRequirePermission:
 
         assert resource_id_1 == resource_id_2
         assert resource_id_1 == "thread-123"
+
+    def test_for_route_with_thread_id(self, mock_request):
+        """Test for_route binds a specialized thread_id extractor."""
+        permission = RequirePermission.for_route(
+            "/v1/threads/{thread_id}/state", "checkpointer", "read"
+        )
+
+        assert permission.resource == "checkpointer"
+        assert permission.action == "read"
+        mock_request.path_params = {"thread_id": "thread-123"}
+        assert permission.extract_resource_id_fn(mock_request) == "thread-123"
+
+    def test_for_route_converter_placeholder(self, mock_request):
+        """Test for_route parses `{param:converter}` placeholders."""
+        permission = RequirePermission.for_route(
+            "/v1/threads/{thread_id:path}", "checkpointer", "read"
+        )
+
+        mock_request.path_params = {"thread_id": 42}
+        assert permission.extract_resource_id_fn(mock_request) == "42"
+
+    def test_for_route_without_recognized_param(self, mock_request):
+        """Test for_route on a path without recognized placeholders returns None."""
+        permission = RequirePermission.for_route("/v1/graph/invoke", "graph", "invoke")
+
+        mock_request.path_params = {"other": "value"}
+        assert permission.extract_resource_id_fn(mock_request) is None
+
+    def test_for_route_priority(self, mock_request):
+        """Test for_route picks the highest-priority placeholder."""
+        permission = RequirePermission.for_route(
+            "/v1/{namespace}/threads/{thread_id}", "store", "read"
+        )
+
+        mock_request.path_params = {"namespace": "ns", "thread_id": "t-1"}
+        assert permission.extract_resource_id_fn(mock_request) == "t-1"
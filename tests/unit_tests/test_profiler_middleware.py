@@ -0,0 +1,56 @@
+"""Unit tests for the pyinstrument profiler middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from agentflow_cli.src.app.core.middleware.profiler import ProfilerMiddleware
+
+
+@pytest.fixture
+def app_with_profiler():
+    """Create a FastAPI app with the profiler middleware mounted."""
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware)
+
+    @app.get("/test")
+    async def test_endpoint():
+        return {"status": "ok"}
+
+    return app
+
+
+def test_passthrough_without_flag(app_with_profiler):
+    """Requests without ?profile=1 get the normal response."""
+    client = TestClient(app_with_profiler)
+
+    response = client.get("/test")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_profile_flag_other_value_is_passthrough(app_with_profiler):
+    """Only the exact value '1' activates profiling."""
+    client = TestClient(app_with_profiler)
+
+    response = client.get("/test", params={"profile": "yes"})
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_profile_flag_returns_html_or_passthrough(app_with_profiler):
+    """With ?profile=1 the middleware returns the HTML report when pyinstrument
+    is installed, and degrades to the normal response when it is not."""
+    client = TestClient(app_with_profiler)
+
+    response = client.get("/test", params={"profile": "1"})
+
+    assert response.status_code == 200
+    try:
+        import pyinstrument  # noqa: F401
+    except ImportError:
+        assert response.json() == {"status": "ok"}
+    else:
+        assert response.headers["content-type"].startswith("text/html")
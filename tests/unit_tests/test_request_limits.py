@@ -93,3 +93,46 @@ def test_error_response_format(app_with_limit):
     assert "max_size_mb" in error
     assert error["max_size_bytes"] == 1024
     assert error["max_size_mb"] == 1024 / (1024 * 1024)
+
+
+def test_malformed_content_length_rejected(app_with_limit):
+    """Test that a malformed Content-Length header returns 400, not a server error."""
+    client = TestClient(app_with_limit)
+
+    response = client.post(
+        "/test",
+        content=b"{}",
+        headers={"Content-Length": "not-a-number", "Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_CONTENT_LENGTH"
+
+
+def test_chunked_body_over_limit(app_with_limit):
+    """Test that chunked bodies without Content-Length are still capped."""
+    client = TestClient(app_with_limit)
+
+    def body():
+        for _ in range(20):
+            yield b"x" * 256  # 5KB total, over the 1KB limit
+
+    response = client.post(
+        "/test", content=body(), headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 413
+
+
+def test_chunked_body_under_limit(app_with_limit):
+    """Test that small chunked bodies pass through."""
+    client = TestClient(app_with_limit)
+
+    def body():
+        yield b'{"message": "hi"}'
+
+    response = client.post(
+        "/test", content=body(), headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 200
@@ -19,6 +19,17 @@ def test_mode_normalization():
         assert settings.MODE == "development"
 
 
+def test_hsts_force_normalization():
+    """Test that HSTS_FORCE is lowercased and invalid values fall back to auto."""
+    with patch.dict(os.environ, {"HSTS_FORCE": "Always"}):
+        settings = Settings()
+        assert settings.HSTS_FORCE == "always"
+
+    with patch.dict(os.environ, {"HSTS_FORCE": "alwys"}):
+        settings = Settings()
+        assert settings.HSTS_FORCE == "auto"
+
+
 def test_cors_wildcard_warning_in_production(caplog):
     """Test warning for CORS wildcard in production."""
     with patch.dict(os.environ, {"MODE": "production", "ORIGINS": "*"}):
@@ -56,6 +56,28 @@ def test_basic_security_headers_added(client_with_headers):
     assert response.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
 
 
+def test_app_set_headers_are_not_duplicated(app):
+    """Test that a header the route sets itself wins over the middleware's."""
+    from fastapi.responses import JSONResponse
+
+    @app.get("/custom-csp")
+    async def custom_csp():
+        return JSONResponse(
+            {"message": "ok"},
+            headers={"Content-Security-Policy": "default-src 'self' https://cdn.example.com"},
+        )
+
+    app.add_middleware(SecurityHeadersMiddleware)
+    client = TestClient(app)
+
+    response = client.get("/custom-csp")
+
+    csp_values = response.headers.get_list("Content-Security-Policy")
+    assert csp_values == ["default-src 'self' https://cdn.example.com"]
+    # Headers the route did not set are still added
+    assert response.headers["X-Frame-Options"] == "DENY"
+
+
 def test_permissions_policy_added(client_with_headers):
     """Test that Permissions-Policy header is added."""
     response = client_with_headers.get("/test")
@@ -316,3 +338,72 @@ def test_none_csp_policy_uses_default(app):
     # Should use default CSP
     assert "Content-Security-Policy" in response.headers
     assert "default-src 'self'" in response.headers["Content-Security-Policy"]
+
+
+def test_force_hsts_always(app):
+    """Test force_hsts="always" sends HSTS even over plain HTTP."""
+    app.add_middleware(SecurityHeadersMiddleware, force_hsts="always")
+    client = TestClient(app)
+
+    response = client.get("/test")
+
+    assert "Strict-Transport-Security" in response.headers
+
+
+def test_force_hsts_never(app):
+    """Test force_hsts="never" suppresses HSTS even over HTTPS."""
+    app.add_middleware(SecurityHeadersMiddleware, force_hsts="never")
+    client = TestClient(app, base_url="https://testserver")
+
+    response = client.get("/test")
+
+    assert "Strict-Transport-Security" not in response.headers
+
+
+def test_etag_disabled_by_default(client_with_headers):
+    """Test that no ETag is emitted unless enable_etag is set."""
+    response = client_with_headers.get("/test")
+
+    assert "ETag" not in response.headers
+
+
+def test_etag_emitted_when_enabled(app):
+    """Test that a weak ETag is emitted on 200 GET responses."""
+    app.add_middleware(SecurityHeadersMiddleware, enable_etag=True)
+    client = TestClient(app)
+
+    response = client.get("/test")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('W/"')
+    # Security headers still applied on the buffered path
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+
+def test_etag_if_none_match_returns_304(app):
+    """Test that a matching If-None-Match gets a 304 with no body."""
+    app.add_middleware(SecurityHeadersMiddleware, enable_etag=True)
+    client = TestClient(app)
+
+    first = client.get("/test")
+    etag = first.headers["ETag"]
+    second = client.get("/test", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.content == b""
+
+
+def test_etag_304_keeps_security_headers(app):
+    """Test that a 304 retains security headers and drops body-specific ones."""
+    app.add_middleware(SecurityHeadersMiddleware, enable_etag=True)
+    client = TestClient(app)
+
+    first = client.get("/test")
+    second = client.get("/test", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert second.status_code == 304
+    assert second.headers["X-Content-Type-Options"] == "nosniff"
+    assert second.headers["X-Frame-Options"] == "DENY"
+    assert "Content-Length" not in second.headers
+    assert "Content-Type" not in second.headers
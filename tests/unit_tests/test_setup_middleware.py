@@ -339,6 +339,7 @@ def test_attach_otel_publisher_existing_single():
 
 
 class MockSettings:
+    MODE = "development"
     OTEL_ENABLED = True
     OTEL_SERVICE_NAME = "test-service"
     OTEL_EXPORTER_OTLP_ENDPOINT = None
@@ -350,6 +351,7 @@ class MockSettings:
     HSTS_MAX_AGE = 31536000
     HSTS_INCLUDE_SUBDOMAINS = True
     HSTS_PRELOAD = True
+    HSTS_FORCE = "auto"
     FRAME_OPTIONS = "DENY"
     CONTENT_TYPE_OPTIONS = "nosniff"
     XSS_PROTECTION = "1; mode=block"
@@ -26,7 +26,9 @@ def _make_websocket(receive_side_effects: list) -> MagicMock:
     ws.accept = AsyncMock()
     ws.send_text = AsyncMock()
     ws.close = AsyncMock()
-    ws.receive_json = AsyncMock(side_effect=receive_side_effects)
+    # The endpoint reads text frames; serialize dict payloads the way a client would.
+    effects = [json.dumps(e) if isinstance(e, dict) else e for e in receive_side_effects]
+    ws.receive_text = AsyncMock(side_effect=effects)
     return ws
 
 